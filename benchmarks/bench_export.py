@@ -0,0 +1,56 @@
+# Compare the bulk Excel export with the original cell-by-cell writer
+#
+# Usage: python -m benchmarks.bench_export [clients] [days]
+import sys
+import time
+from io import BytesIO
+
+from openpyxl import load_workbook
+
+from benchmarks.legacy import legacy_create_combined_excel_file
+from benchmarks.synthetic import make_remarks
+from mc06.export import create_combined_excel_file
+from mc06.metrics import aggregate_client_days, classify_rows, daily_summaries, overall_summary
+
+
+# Every cell's value and number format plus column widths, sheet by sheet
+def workbook_contents(data):
+    workbook = load_workbook(BytesIO(data))
+    contents = {}
+    for sheet in workbook.worksheets:
+        cells = [(cell.coordinate, cell.value, cell.number_format, cell.border.left.style)
+                 for row in sheet.iter_rows() for cell in row]
+        widths = {key: dim.width for key, dim in sheet.column_dimensions.items()}
+        contents[sheet.title] = (cells, widths)
+    return contents
+
+
+def _timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main(clients=50, days=90):
+    df = make_remarks(clients * days * 60, clients, days)
+    client_days = aggregate_client_days(classify_rows(df))
+    summary_dfs = daily_summaries(client_days)
+    overall_summary_df = overall_summary(client_days, "JAN 01 2025 - MAR 31 2025")
+
+    expected, legacy_seconds = _timed(legacy_create_combined_excel_file, summary_dfs, overall_summary_df)
+    actual, bulk_seconds = _timed(create_combined_excel_file, summary_dfs, overall_summary_df, constant_memory=False)
+    streamed, constant_seconds = _timed(create_combined_excel_file, summary_dfs, overall_summary_df, constant_memory=True)
+
+    expected_contents = workbook_contents(expected)
+    assert workbook_contents(actual) == expected_contents, "bulk export differs"
+    assert workbook_contents(streamed) == expected_contents, "constant_memory export differs"
+
+    print(f"{clients} clients x {days} days")
+    print(f"legacy export:          {legacy_seconds:8.3f}s")
+    print(f"bulk export:            {bulk_seconds:8.3f}s ({legacy_seconds / bulk_seconds:.1f}x)")
+    print(f"constant_memory export: {constant_seconds:8.3f}s ({legacy_seconds / constant_seconds:.1f}x)")
+    print("workbooks identical")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,36 @@
+# Compare the vectorized Daily Summary engine with the original per-client/per-day loop
+#
+# Usage: python -m benchmarks.bench_metrics [rows] [clients] [days]
+import sys
+import time
+
+import pandas as pd
+
+from benchmarks.legacy import legacy_daily_summaries
+from benchmarks.synthetic import make_remarks
+from mc06.metrics import aggregate_client_days, classify_rows, daily_summaries
+
+
+def main(rows=200_000, clients=30, days=31):
+    df = make_remarks(rows, clients, days)
+
+    start = time.perf_counter()
+    expected = legacy_daily_summaries(df)
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = daily_summaries(aggregate_client_days(classify_rows(df)))
+    engine_seconds = time.perf_counter() - start
+
+    assert list(actual) == list(expected), "client order differs"
+    for client, expected_df in expected.items():
+        pd.testing.assert_frame_equal(actual[client], expected_df, check_dtype=False)
+
+    print(f"{rows} rows, {clients} clients, {days} days")
+    print(f"legacy loop:    {legacy_seconds:8.3f}s")
+    print(f"metrics engine: {engine_seconds:8.3f}s ({legacy_seconds / engine_seconds:.1f}x)")
+    print("outputs identical")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
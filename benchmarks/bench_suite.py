@@ -0,0 +1,111 @@
+# Time loading, the summaries and the export of synthetic remark files at several sizes,
+# and check every result against golden outputs of the original implementation
+#
+# Usage: python -m benchmarks.bench_suite [rows ...]
+#
+# Workbooks and golden results are generated once per size and kept in MC06_BENCH_DIR,
+# so later runs only time the current implementation.
+import os
+import sys
+import tempfile
+import time
+from io import BytesIO
+
+import pandas as pd
+
+from benchmarks.bench_export import workbook_contents
+from benchmarks.legacy import (legacy_create_combined_excel_file, legacy_daily_summaries, legacy_load_data,
+                               legacy_overall_summary)
+from benchmarks.synthetic import make_remarks, write_workbook
+from mc06.export import create_combined_excel_file
+from mc06.ingest import write_atomic
+from mc06.reader import read_remarks
+from mc06.report import build_report, format_date_range
+
+BENCH_DIR = os.environ.get('MC06_BENCH_DIR', os.path.join(tempfile.gettempdir(), 'mc06_bench'))
+
+# Bump when make_remarks changes, so files and golden results are generated again
+GENERATOR_VERSION = 1
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+# Shape of every generated file, fixed so timings of different runs compare
+SHAPE = {'clients': 30, 'days': 31, 'agents': 40}
+
+STAGES = ['load', 'summaries', 'export']
+
+
+def _timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+# Path of the synthetic workbook with this many rows, generated on first use
+def ensure_workbook(rows, seed=0):
+    path = os.path.join(BENCH_DIR, f"remarks-v{GENERATOR_VERSION}-{rows}-s{seed}.xlsx")
+    if not os.path.exists(path):
+        df = make_remarks(rows, **SHAPE, seed=seed)
+        write_atomic(path, lambda tmp_path: write_workbook(df, tmp_path))
+    return path
+
+
+# Outputs and timings of the original implementation for a workbook, computed once
+def golden_results(path):
+    golden_path = os.path.splitext(path)[0] + '.golden.pkl'
+    if os.path.exists(golden_path):
+        return pd.read_pickle(golden_path)
+
+    df, load_seconds = _timed(legacy_load_data, path)
+    start = time.perf_counter()
+    date_range_str = format_date_range(df['Date'].min().date(), df['Date'].max().date())
+    summary_dfs = legacy_daily_summaries(df)
+    overall_summary_df = legacy_overall_summary(df, date_range_str)
+    summaries_seconds = time.perf_counter() - start
+    export, export_seconds = _timed(legacy_create_combined_excel_file, summary_dfs, overall_summary_df)
+
+    golden = {
+        'rows': len(df),
+        'summary_dfs': summary_dfs,
+        'overall_summary_df': overall_summary_df,
+        'export': export,
+        'seconds': {'load': load_seconds, 'summaries': summaries_seconds, 'export': export_seconds},
+    }
+    write_atomic(golden_path, lambda tmp_path: pd.to_pickle(golden, tmp_path))
+    return golden
+
+
+# Time the current implementation on one workbook and compare its outputs with the golden ones
+def run(rows, seed=0):
+    path = ensure_workbook(rows, seed)
+    golden = golden_results(path)
+    with open(path, 'rb') as remark_file:
+        data = remark_file.read()
+
+    df, load_seconds = _timed(read_remarks, BytesIO(data))
+    (summary_dfs, overall_summary_df), summaries_seconds = _timed(build_report, df)
+    export, export_seconds = _timed(create_combined_excel_file, summary_dfs, overall_summary_df)
+
+    assert len(df) == golden['rows'], f"{rows} rows: loaded {len(df)} rows, expected {golden['rows']}"
+    assert list(summary_dfs) == list(golden['summary_dfs']), f"{rows} rows: client order differs"
+    for client, expected_df in golden['summary_dfs'].items():
+        pd.testing.assert_frame_equal(summary_dfs[client], expected_df, check_dtype=False, check_categorical=False)
+    pd.testing.assert_frame_equal(overall_summary_df, golden['overall_summary_df'],
+                                  check_dtype=False, check_categorical=False)
+    assert workbook_contents(export) == workbook_contents(golden['export']), f"{rows} rows: export differs"
+
+    return golden['seconds'], {'load': load_seconds, 'summaries': summaries_seconds, 'export': export_seconds}
+
+
+def main(sizes=None):
+    print(f"{'rows':>10} {'stage':<10} {'legacy':>10} {'current':>10} {'speedup':>8}")
+    for rows in sizes or SIZES:
+        legacy_seconds, current_seconds = run(rows)
+        for name in STAGES:
+            speedup = legacy_seconds[name] / current_seconds[name]
+            print(f"{rows:>10} {name:<10} {legacy_seconds[name]:9.3f}s {current_seconds[name]:9.3f}s {speedup:7.1f}x")
+    print("outputs match the golden results")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]])
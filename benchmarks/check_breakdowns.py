@@ -0,0 +1,25 @@
+# Check that the skip breakdowns and status lists cover every client of the Daily Summary,
+# including a client whose rows all have a blank Status
+#
+# Usage: python -m benchmarks.check_breakdowns
+from benchmarks.synthetic import make_remarks
+from mc06.cube import build_cubes
+from mc06.metrics import client_statuses, daily_summaries, skip_breakdown
+from mc06.normalize import normalize_remarks
+
+
+def main():
+    raw = make_remarks(500, clients=3, days=2)
+    raw.loc[raw['Client'] == 'CLIENT 01', 'Status'] = None
+    client_days, status_days = build_cubes(normalize_remarks(raw))
+
+    breakdown = skip_breakdown(status_days)
+    assert 'CLIENT 01' not in set(breakdown['Client']), "blank statuses counted as skips"
+    for client in daily_summaries(client_days):
+        statuses = client_statuses(status_days, client)
+        assert len(statuses) > 0, f"no statuses listed for {client}"
+    print("statuses listed for every client, blank-only client included")
+
+
+if __name__ == '__main__':
+    main()
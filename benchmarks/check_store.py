@@ -0,0 +1,38 @@
+# Check that appending overlapping exports to the history store keeps every row once,
+# whatever types each file's columns were read as
+#
+# Usage: python -m benchmarks.check_store
+import tempfile
+from datetime import date
+
+from benchmarks.synthetic import make_remarks
+from mc06 import store
+from mc06.normalize import normalize_remarks
+
+
+def main():
+    raw = make_remarks(200, clients=3, days=1, broken_promise=0)
+    raw['Call Duration'] = raw['Call Duration'].fillna(0)
+    first = normalize_remarks(raw.iloc[:100].copy())
+
+    # A later export of the same day: the same rows plus one fractional duration, so its
+    # durations stay float64 while the first file's were downcast to integers
+    later = raw.copy()
+    later.loc[150, 'Call Duration'] = 12.5
+    later['Account No.'] = later['Account No.'].astype(str)
+    later = normalize_remarks(later)
+    assert first['Call Duration'].dtype != later['Call Duration'].dtype
+
+    with tempfile.TemporaryDirectory() as store_dir:
+        store.STORE_DIR = store_dir
+        store.append_remarks(first, 'first')
+        store.append_remarks(later, 'later')
+        day = date(2025, 1, 1)
+        stored = store.load_range(day, day)
+
+    assert len(stored) == len(later), f"stored {len(stored)} rows, expected {len(later)}"
+    print(f"{len(first)} + {len(later)} overlapping rows stored as {len(stored)}")
+
+
+if __name__ == '__main__':
+    main()
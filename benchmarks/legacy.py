@@ -0,0 +1,218 @@
+# The report as main.py computed it before the optimizations, kept as the reference
+# that benchmarks check the current implementation against
+import math
+import re
+from io import BytesIO
+
+import pandas as pd
+
+from mc06.skip_status import positive_skip_keywords, negative_skip_status
+
+
+# The only change from the original code: the keywords are escaped. The old regex read
+# "(SMS & EMAIL)" as a group and never matched that status, which the skip-status
+# classifier now matches literally.
+def _positive_skip_pattern():
+    return '|'.join(re.escape(keyword) for keyword in positive_skip_keywords)
+
+
+# load_data as main.py defined it before the streaming reader
+def legacy_load_data(source):
+    df = pd.read_excel(source)
+    # Filter out rows where 'Remark' contains "broken promise" (case-insensitive)
+    df = df[~df['Remark'].astype(str).str.contains("broken promise", case=False, na=False)]
+    return df
+
+
+# The Daily Summary as main.py computed it before the metrics engine
+def legacy_daily_summaries(filtered_df):
+    positive_skip_pattern = _positive_skip_pattern()
+    summary_dfs = {}
+    for client, client_group in filtered_df.groupby('Client'):
+        summary_table = []
+        for date, date_group in client_group.groupby(client_group['Date'].dt.date):
+            valid_group = date_group[(date_group['Call Duration'].notna()) &
+                                    (date_group['Call Duration'] > 0) &
+                                    (date_group['Remark By'].str.lower() != "system")]
+            total_agents = valid_group['Remark By'].nunique()
+            total_connected = date_group[date_group['Call Status'] == 'CONNECTED']['Account No.'].count()
+            total_talk_time_seconds = date_group['Talk Time Duration'].sum()
+            hours, remainder = divmod(int(total_talk_time_seconds), 3600)
+            minutes, seconds = divmod(remainder, 60)
+            formatted_talk_time = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+            talk_time_ave_seconds = total_talk_time_seconds / total_agents if total_agents > 0 else 0
+            ave_hours, ave_remainder = divmod(int(talk_time_ave_seconds), 3600)
+            ave_minutes, ave_seconds = divmod(ave_remainder, 60)
+            talk_time_ave_str = f"{ave_hours:02d}:{ave_minutes:02d}:{ave_seconds:02d}"
+            positive_skip_count = sum(date_group['Status'].astype(str).str.contains(positive_skip_pattern, case=False, na=False))
+            negative_skip_count = date_group[date_group['Status'].isin(negative_skip_status)].shape[0]
+            total_skip = positive_skip_count + negative_skip_count
+            positive_skip_connected = date_group[(date_group['Call Status'] == 'CONNECTED') &
+                                                (date_group['Status'].astype(str).str.contains(positive_skip_pattern, case=False, na=False))]['Account No.'].count()
+            negative_skip_connected = date_group[(date_group['Call Status'] == 'CONNECTED') &
+                                                (date_group['Status'].isin(negative_skip_status))]['Account No.'].count()
+            positive_skip_talk_time_seconds = date_group[(date_group['Call Status'] == 'CONNECTED') &
+                                                        (date_group['Status'].astype(str).str.contains(positive_skip_pattern, case=False, na=False))]['Talk Time Duration'].sum()
+            negative_skip_talk_time_seconds = date_group[(date_group['Call Status'] == 'CONNECTED') &
+                                                        (date_group['Status'].isin(negative_skip_status))]['Talk Time Duration'].sum()
+            pos_hours, pos_remainder = divmod(int(positive_skip_talk_time_seconds), 3600)
+            pos_minutes, pos_seconds = divmod(pos_remainder, 60)
+            positive_skip_talk_time = f"{pos_hours:02d}:{pos_minutes:02d}:{pos_seconds:02d}"
+            neg_hours, neg_remainder = divmod(int(negative_skip_talk_time_seconds), 3600)
+            neg_minutes, neg_seconds = divmod(neg_remainder, 60)
+            negative_skip_talk_time = f"{neg_hours:02d}:{neg_minutes:02d}:{neg_seconds:02d}"
+            positive_skip_ave = round(positive_skip_count / total_agents, 2) if total_agents > 0 else 0
+            negative_skip_ave = round(negative_skip_count / total_agents, 2) if total_agents > 0 else 0
+            total_skip_ave = round(total_skip / total_agents, 2) if total_agents > 0 else 0
+            connected_ave = round(total_connected / total_agents, 2) if total_agents > 0 else 0
+            summary_table.append([
+                date, total_agents, total_connected, positive_skip_count, negative_skip_count, total_skip,
+                positive_skip_connected, negative_skip_connected, positive_skip_talk_time, negative_skip_talk_time,
+                formatted_talk_time, positive_skip_ave, negative_skip_ave, total_skip_ave, connected_ave, talk_time_ave_str
+            ])
+        summary_dfs[client] = pd.DataFrame(summary_table, columns=[
+            'Day', 'Collectors', 'Total Connected', 'Positive Skip', 'Negative Skip', 'Total Skip',
+            'Positive Skip Connected', 'Negative Skip Connected', 'Positive Skip Talk Time', 'Negative Skip Talk Time',
+            'Talk Time (HH:MM:SS)', 'Positive Skip Ave', 'Negative Skip Ave', 'Total Skip Ave', 'Connected Ave', 'Talk Time Ave'
+        ])
+    return summary_dfs
+
+
+# The Overall Summary as main.py computed it before it was built from the per-day aggregates
+def legacy_overall_summary(filtered_df, date_range_str):
+    positive_skip_pattern = _positive_skip_pattern()
+    valid_df = filtered_df[(filtered_df['Call Duration'].notna()) &
+                           (filtered_df['Call Duration'] > 0) &
+                           (filtered_df['Remark By'].str.lower() != "system")]
+    avg_collectors_per_client = valid_df.groupby(['Client', valid_df['Date'].dt.date])['Remark By'].nunique().groupby('Client').mean().apply(lambda x: math.ceil(x) if x % 1 >= 0.5 else round(x))
+
+    overall_summary = []
+    for client, client_group in filtered_df.groupby('Client'):
+        total_agents = avg_collectors_per_client.get(client, 0)
+        total_connected = client_group[client_group['Call Status'] == 'CONNECTED']['Account No.'].count()
+        total_talk_time_seconds = client_group['Talk Time Duration'].sum()
+        hours, remainder = divmod(int(total_talk_time_seconds), 3600)
+        minutes, seconds = divmod(remainder, 60)
+        formatted_talk_time = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        positive_skip_count = sum(client_group['Status'].astype(str).str.contains(positive_skip_pattern, case=False, na=False))
+        negative_skip_count = client_group[client_group['Status'].isin(negative_skip_status)].shape[0]
+        total_skip = positive_skip_count + negative_skip_count
+        positive_skip_connected = client_group[(client_group['Call Status'] == 'CONNECTED') &
+                                              (client_group['Status'].astype(str).str.contains(positive_skip_pattern, case=False, na=False))]['Account No.'].count()
+        negative_skip_connected = client_group[(client_group['Call Status'] == 'CONNECTED') &
+                                              (client_group['Status'].isin(negative_skip_status))]['Account No.'].count()
+        positive_skip_talk_time_seconds = client_group[(client_group['Call Status'] == 'CONNECTED') &
+                                                      (client_group['Status'].astype(str).str.contains(positive_skip_pattern, case=False, na=False))]['Talk Time Duration'].sum()
+        negative_skip_talk_time_seconds = client_group[(client_group['Call Status'] == 'CONNECTED') &
+                                                      (client_group['Status'].isin(negative_skip_status))]['Talk Time Duration'].sum()
+        pos_hours, pos_remainder = divmod(int(positive_skip_talk_time_seconds), 3600)
+        pos_minutes, pos_seconds = divmod(pos_remainder, 60)
+        positive_skip_talk_time = f"{pos_hours:02d}:{pos_minutes:02d}:{pos_seconds:02d}"
+        neg_hours, neg_remainder = divmod(int(negative_skip_talk_time_seconds), 3600)
+        neg_minutes, neg_seconds = divmod(neg_remainder, 60)
+        negative_skip_talk_time = f"{neg_hours:02d}:{neg_minutes:02d}:{neg_seconds:02d}"
+        daily_data = client_group.groupby(client_group['Date'].dt.date).agg({
+            'Remark By': lambda x: x[(client_group['Call Duration'].notna()) &
+                                    (client_group['Call Duration'] > 0) &
+                                    (client_group['Remark By'].str.lower() != "system")].nunique(),
+            'Account No.': lambda x: x[client_group['Call Status'] == 'CONNECTED'].count(),
+            'Status': [
+                lambda x: sum(x.astype(str).str.contains(positive_skip_pattern, case=False, na=False)),
+                lambda x: x.isin(negative_skip_status).sum(),
+                lambda x: x[(client_group['Call Status'] == 'CONNECTED') &
+                           (x.astype(str).str.contains(positive_skip_pattern, case=False, na=False))].count(),
+                lambda x: x[(client_group['Call Status'] == 'CONNECTED') &
+                           (x.isin(negative_skip_status))].count()
+            ],
+            'Talk Time Duration': [
+                'sum',
+                lambda x: x[(client_group['Call Status'] == 'CONNECTED') &
+                           (client_group['Status'].astype(str).str.contains(positive_skip_pattern, case=False, na=False))].sum(),
+                lambda x: x[(client_group['Call Status'] == 'CONNECTED') &
+                           (client_group['Status'].isin(negative_skip_status))].sum()
+            ]
+        })
+        daily_data.columns = ['Collectors', 'Total Connected',
+                              'Positive Skip', 'Negative Skip', 'Positive Skip Connected', 'Negative Skip Connected',
+                              'Talk Time', 'Positive Skip Talk Time Seconds', 'Negative Skip Talk Time Seconds']
+        daily_data['Total Skip'] = daily_data['Positive Skip'] + daily_data['Negative Skip']
+        daily_data['Positive Skip Ave'] = daily_data['Positive Skip'] / daily_data['Collectors']
+        daily_data['Negative Skip Ave'] = daily_data['Negative Skip'] / daily_data['Collectors']
+        daily_data['Total Skip Ave'] = daily_data['Total Skip'] / daily_data['Collectors']
+        daily_data['Connected Ave'] = daily_data['Total Connected'] / daily_data['Collectors']
+        daily_data['Talk Time Ave Seconds'] = daily_data['Talk Time'] / daily_data['Collectors']
+        positive_skip_ave = round(daily_data['Positive Skip Ave'].mean(), 2) if not daily_data.empty else 0
+        negative_skip_ave = round(daily_data['Negative Skip Ave'].mean(), 2) if not daily_data.empty else 0
+        total_skip_ave = round(daily_data['Total Skip Ave'].mean(), 2) if not daily_data.empty else 0
+        connected_ave = round(daily_data['Connected Ave'].mean(), 2) if not daily_data.empty else 0
+        talk_time_ave_seconds = daily_data['Talk Time Ave Seconds'].mean() if not daily_data.empty else 0
+        ave_hours, ave_remainder = divmod(int(talk_time_ave_seconds), 3600)
+        ave_minutes, ave_seconds = divmod(ave_remainder, 60)
+        talk_time_ave_str = f"{ave_hours:02d}:{ave_minutes:02d}:{ave_seconds:02d}"
+        overall_summary.append([
+            date_range_str, client, total_agents, total_connected, positive_skip_count, negative_skip_count, total_skip,
+            positive_skip_connected, negative_skip_connected, positive_skip_talk_time, negative_skip_talk_time,
+            positive_skip_ave, negative_skip_ave, total_skip_ave, formatted_talk_time, connected_ave, talk_time_ave_str
+        ])
+    return pd.DataFrame(overall_summary, columns=[
+        'Date Range', 'Client', 'Collectors', 'Total Connected', 'Positive Skip', 'Negative Skip', 'Total Skip',
+        'Positive Skip Connected', 'Negative Skip Connected', 'Positive Skip Talk Time', 'Negative Skip Talk Time',
+        'Positive Skip Ave', 'Negative Skip Ave', 'Total Skip Ave', 'Talk Time (HH:MM:SS)', 'Connected Ave', 'Talk Time Ave'
+    ])
+
+
+# create_combined_excel_file as main.py defined it before the export engine
+def legacy_create_combined_excel_file(summary_dfs, overall_summary_df):
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+        workbook = writer.book
+        header_format = workbook.add_format({
+            'bg_color': '#FF0000', 'font_color': '#FFFFFF', 'bold': True,
+            'border': 1, 'align': 'center', 'valign': 'vcenter'
+        })
+        cell_format = workbook.add_format({'border': 1, 'align': 'center', 'valign': 'vcenter'})
+        date_format = workbook.add_format({
+            'num_format': 'mmm dd, yyyy', 'border': 1, 'align': 'center', 'valign': 'vcenter'
+        })
+        date_range_format = workbook.add_format({'border': 1, 'align': 'center', 'valign': 'vcenter'})
+        time_format = workbook.add_format({
+            'num_format': 'hh:mm:ss', 'border': 1, 'align': 'center', 'valign': 'vcenter'
+        })
+
+        for client, summary_df in summary_dfs.items():
+            summary_df.to_excel(writer, sheet_name=f"Summary_{client[:31]}", index=False, startrow=1, header=False)
+            worksheet = writer.sheets[f"Summary_{client[:31]}"]
+            for col_idx, col in enumerate(summary_df.columns):
+                worksheet.write(0, col_idx, col, header_format)
+            for row_idx in range(len(summary_df)):
+                for col_idx, value in enumerate(summary_df.iloc[row_idx]):
+                    if col_idx == 0:
+                        worksheet.write_datetime(row_idx + 1, col_idx, value, date_format)
+                    elif col_idx in [6, 8, 9]:
+                        worksheet.write(row_idx + 1, col_idx, value, time_format)
+                    else:
+                        worksheet.write(row_idx + 1, col_idx, value, cell_format)
+            for col_idx, col in enumerate(summary_df.columns):
+                if col_idx == 0:
+                    max_length = max(summary_df[col].astype(str).map(lambda x: len('MMM DD, YYYY')).max(), len(str(col)))
+                else:
+                    max_length = max(summary_df[col].astype(str).map(len).max(), len(str(col)))
+                worksheet.set_column(col_idx, col_idx, max_length + 2)
+
+        overall_summary_df.to_excel(writer, sheet_name="Overall_Summary", index=False, startrow=1, header=False)
+        worksheet = writer.sheets["Overall_Summary"]
+        for col_idx, col in enumerate(overall_summary_df.columns):
+            worksheet.write(0, col_idx, col, header_format)
+        for row_idx in range(len(overall_summary_df)):
+            for col_idx, value in enumerate(overall_summary_df.iloc[row_idx]):
+                if col_idx == 0:
+                    worksheet.write(row_idx + 1, col_idx, value, date_range_format)
+                elif col_idx in [10, 12, 13]:
+                    worksheet.write(row_idx + 1, col_idx, value, time_format)
+                else:
+                    worksheet.write(row_idx + 1, col_idx, value, cell_format)
+        for col_idx, col in enumerate(overall_summary_df.columns):
+            max_length = max(overall_summary_df[col].astype(str).map(len).max(), len(str(col)))
+            worksheet.set_column(col_idx, col_idx, max_length + 2)
+
+    return output.getvalue()
@@ -0,0 +1,80 @@
+# Synthetic Daily Remark exports for benchmarks, reproducible from a seed
+import numpy as np
+import pandas as pd
+import xlsxwriter
+
+from mc06.skip_status import positive_skip_keywords, negative_skip_status
+
+# Share of rows given a positive skip, a negative skip or any other status
+STATUS_MIX = {'positive': 0.1, 'negative': 0.1, 'other': 0.8}
+
+# Statuses outside both skip lists; None leaves the cell blank
+NOISE_STATUSES = [
+    "PTP", "PTP - FOLLOW UP", "RPC - CALLBACK", "RPC - REFUSE TO PAY", "NO ANSWER",
+    "BUSY", "WRONG NUMBER", "KEEP ON RINGING", "PAYMENT CONFIRMED", None
+]
+
+# Remarks of ordinary calls, and of those the report drops
+REMARKS = ["CALLED CH, NO ANSWER", "CH WILL PAY ON FRIDAY", "LEFT MESSAGE TO SPOUSE", "SENT SMS REMINDER"]
+BROKEN_PROMISE_REMARKS = ["BROKEN PROMISE - NO PAYMENT RECEIVED", "Broken promise, follow up tomorrow"]
+
+
+def _pick(rng, values, size):
+    return np.array(values, dtype=object)[rng.integers(0, len(values), size)]
+
+
+# Random remark rows shaped like a Daily Remark export: every report column, blank
+# statuses and durations, "System" rows and "broken promise" remarks included.
+# status_mix maps 'positive', 'negative' and 'other' to their share of the rows.
+def make_remarks(rows, clients=30, days=31, agents=40, status_mix=None, broken_promise=0.02,
+                 system_rows=0.05, seed=0):
+    rng = np.random.default_rng(seed)
+    status_mix = status_mix or STATUS_MIX
+    pools = [positive_skip_keywords, negative_skip_status, NOISE_STATUSES]
+    weights = np.array([status_mix.get(kind, 0) for kind in ['positive', 'negative', 'other']], dtype=float)
+    kinds = rng.choice(len(pools), size=rows, p=weights / weights.sum())
+    statuses = np.empty(rows, dtype=object)
+    for kind, pool in enumerate(pools):
+        in_pool = kinds == kind
+        statuses[in_pool] = _pick(rng, pool, in_pool.sum())
+
+    dates = pd.date_range("2025-01-01", periods=days, freq="D")
+    agent_names = np.array([f"AGENT{i:03d}" for i in range(agents)], dtype=object)
+    remark_by = np.where(rng.random(rows) < system_rows, "System", _pick(rng, agent_names, rows))
+    connected = rng.random(rows) < 0.4
+    # Unanswered calls have no duration; a few cells are left blank
+    call_duration = np.where(rng.random(rows) < 0.8, rng.integers(1, 900, rows), 0).astype(float)
+    call_duration[rng.random(rows) < 0.01] = np.nan
+    talk_time = np.where(connected, rng.integers(0, 600, rows), 0).astype(float)
+    remarks = np.where(rng.random(rows) < broken_promise,
+                       _pick(rng, BROKEN_PROMISE_REMARKS, rows), _pick(rng, REMARKS, rows))
+    seconds = pd.to_datetime(rng.integers(8 * 3600, 20 * 3600, rows), unit='s')
+
+    return pd.DataFrame({
+        'Date': dates[rng.integers(0, days, rows)],
+        'Time': seconds.strftime('%H:%M:%S'),
+        'Client': _pick(rng, [f"CLIENT {i:02d}" for i in range(clients)], rows),
+        'Status': statuses,
+        'Call Status': np.where(connected, 'CONNECTED', 'NOT CONNECTED'),
+        'Remark': remarks,
+        'Remark By': remark_by,
+        'Account No.': rng.integers(100000, 999999, rows),
+        'Talk Time Duration': talk_time,
+        'Call Duration': call_duration,
+    })
+
+
+# Save a remark frame as an .xlsx export, streaming rows so a million of them fit in memory
+def write_workbook(df, path):
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+    worksheet = workbook.add_worksheet()
+    date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+    formats = [date_format if pd.api.types.is_datetime64_any_dtype(df[col]) else None for col in df.columns]
+    worksheet.write_row(0, 0, list(df.columns))
+    columns = [df[col].astype(object).where(df[col].notna(), None).tolist() for col in df.columns]
+    for row_idx, row in enumerate(zip(*columns), start=1):
+        for col_idx, value in enumerate(row):
+            # Missing values stay blank cells
+            if value is not None:
+                worksheet.write(row_idx, col_idx, value, formats[col_idx])
+    workbook.close()
@@ -1,7 +1,15 @@
-import pandas as pd
 import streamlit as st
-import math
-from io import BytesIO
+
+from mc06.cube import build_cubes, slice_cube
+from mc06.export import create_combined_excel_file
+from mc06.ingest import file_digest, load_remarks
+from mc06.instrument import RunProfile, count, set_active_profile, stage
+from mc06.metrics import BREAKDOWN_COLUMNS, client_statuses, daily_summaries, overall_summary, skip_breakdown
+from mc06.normalize import memory_usage
+from mc06.report import format_date_range
+from mc06.results import cached_result, result_key
+from mc06.skip_status import CLASSIFIER_VERSION, negative_skip_status
+from mc06.store import append_remarks, load_cube_range, store_version, stored_days
 
 # Set up the page configuration
 st.set_page_config(layout="wide", page_title="MC06 MONITORING", page_icon="📊", initial_sidebar_state="expanded")
@@ -9,385 +17,190 @@ st.set_page_config(layout="wide", page_title="MC06 MONITORING", page_icon="📊"
 # Title of the app
 st.title('MC06 MONITORING')
 
-# Data loading function with file upload support
-@st.cache_data
-def load_data(uploaded_file):
-    df = pd.read_excel(uploaded_file)
-    # Filter out rows where 'Remark' contains "broken promise" (case-insensitive)
-    df = df[~df['Remark'].astype(str).str.contains("broken promise", case=False, na=False)]
-    return df
-
-# Function to create a single Excel file with multiple sheets, auto-fit columns, borders, middle alignment, red headers, and custom date formats
-def create_combined_excel_file(summary_dfs, overall_summary_df):
-    output = BytesIO()
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-        workbook = writer.book
-        header_format = workbook.add_format({
-            'bg_color': '#FF0000',  # Red background
-            'font_color': '#FFFFFF',  # White text
-            'bold': True,
-            'border': 1,
-            'align': 'center',
-            'valign': 'vcenter'
-        })
-        cell_format = workbook.add_format({
-            'border': 1,
-            'align': 'center',
-            'valign': 'vcenter'
-        })
-        date_format = workbook.add_format({
-            'num_format': 'mmm dd, yyyy',  # e.g., Mar 25, 2025
-            'border': 1,
-            'align': 'center',
-            'valign': 'vcenter'
-        })
-        date_range_format = workbook.add_format({
-            'border': 1,
-            'align': 'center',
-            'valign': 'vcenter'
-        })
-        time_format = workbook.add_format({
-            'num_format': 'hh:mm:ss',  # e.g., 01:23:45
-            'border': 1,
-            'align': 'center',
-            'valign': 'vcenter'
-        })
-
-        for client, summary_df in summary_dfs.items():
-            summary_df.to_excel(writer, sheet_name=f"Summary_{client[:31]}", index=False, startrow=1, header=False)
-            worksheet = writer.sheets[f"Summary_{client[:31]}"]
-            for col_idx, col in enumerate(summary_df.columns):
-                worksheet.write(0, col_idx, col, header_format)
-            for row_idx in range(len(summary_df)):
-                for col_idx, value in enumerate(summary_df.iloc[row_idx]):
-                    if col_idx == 0:  # 'Day' column
-                        worksheet.write_datetime(row_idx + 1, col_idx, value, date_format)
-                    elif col_idx in [6, 8, 9]:  # Talk Time columns (Total, Positive Skip, Negative Skip)
-                        worksheet.write(row_idx + 1, col_idx, value, time_format)
-                    else:
-                        worksheet.write(row_idx + 1, col_idx, value, cell_format)
-            for col_idx, col in enumerate(summary_df.columns):
-                if col_idx == 0:
-                    max_length = max(summary_df[col].astype(str).map(lambda x: len('MMM DD, YYYY')).max(), len(str(col)))
-                else:
-                    max_length = max(summary_df[col].astype(str).map(len).max(), len(str(col)))
-                worksheet.set_column(col_idx, col_idx, max_length + 2)
-
-        overall_summary_df.to_excel(writer, sheet_name="Overall_Summary", index=False, startrow=1, header=False)
-        worksheet = writer.sheets["Overall_Summary"]
-        for col_idx, col in enumerate(overall_summary_df.columns):
-            worksheet.write(0, col_idx, col, header_format)
-        for row_idx in range(len(overall_summary_df)):
-            for col_idx, value in enumerate(overall_summary_df.iloc[row_idx]):
-                if col_idx == 0:  # 'Date Range' column
-                    worksheet.write(row_idx + 1, col_idx, value, date_range_format)
-                elif col_idx in [10, 12, 13]:  # Talk Time columns (Total, Positive Skip, Negative Skip)
-                    worksheet.write(row_idx + 1, col_idx, value, time_format)
-                else:
-                    worksheet.write(row_idx + 1, col_idx, value, cell_format)
-        for col_idx, col in enumerate(overall_summary_df.columns):
-            if col_idx == 0:
-                max_length = max(overall_summary_df[col].astype(str).map(len).max(), len(str(col)))
-            else:
-                max_length = max(overall_summary_df[col].astype(str).map(len).max(), len(str(col)))
-            worksheet.set_column(col_idx, col_idx, max_length + 2)
+# Content hash of the uploaded file, computed once per upload instead of on every rerun
+def uploaded_file_digest(uploaded_file):
+    key = f"file_digest_{uploaded_file.file_id}"
+    if key not in st.session_state:
+        st.session_state[key] = file_digest(uploaded_file.getvalue())
+    return st.session_state[key]
 
-    return output.getvalue()
+# Data loading function with file upload support; the workbook is parsed once per
+# distinct file content and kept as Parquet for every later session
+@st.cache_data
+def load_data(file_hash, _uploaded_file):
+    count('load_data cache miss')
+    return load_remarks(_uploaded_file.getvalue(), digest=file_hash)
+
+# Per-client-per-day and per-status aggregate cubes of the uploaded file, built once per file content
+@st.cache_data(max_entries=8)
+def load_cubes(data_hash, classifier_version, _df):
+    count('load_cubes cache miss')
+    return build_cubes(_df)
+
+# Aggregate cubes of the stored history for a date range, from the per-day cubes;
+# the stored remark rows themselves are never read
+@st.cache_data(max_entries=8)
+def load_history_cubes(history_version, classifier_version, start_date, end_date):
+    count('load_history_cubes cache miss')
+    return load_cube_range(start_date, end_date), load_cube_range(start_date, end_date, name='status-cube')
 
 # File uploader for Excel file
 uploaded_file = st.sidebar.file_uploader("Upload Daily Remark File", type="xlsx")
 
-# Define columns outside the conditional block
-col1, col2 = st.columns(2)
-
-if uploaded_file is not None:
-    df = load_data(uploaded_file)
-
-    # Ensure 'Time' column is in datetime format
-    df['Time'] = pd.to_datetime(df['Time'], errors='coerce').dt.time
-
-    # Ensure 'Date' column is in datetime format
-    df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-
-    # Ensure 'Talk Time Duration' and 'Call Duration' are numeric
-    df['Talk Time Duration'] = pd.to_numeric(df['Talk Time Duration'], errors='coerce').fillna(0)
-    df['Call Duration'] = pd.to_numeric(df['Call Duration'], errors='coerce').fillna(0)
-
-    # Define Positive Skip conditions
-    positive_skip_keywords = [
-        "BRGY SKIPTRACE_POS - LEAVE MESSAGE CALL SMS",
-        "BRGY SKIPTRACE_POS - LEAVE MESSAGE FACEBOOK",
-        "POS VIA DIGITAL SKIP - OTHER SOCMED PLATFORMS",
-        "POSITIVE VIA DIGITAL SKIP - FACEBOOK",
-        "POSITIVE VIA DIGITAL SKIP - GOOGLE SEARCH",
-        "POSITIVE VIA DIGITAL SKIP - INSTAGRAM",
-        "POSITIVE VIA DIGITAL SKIP - LINKEDIN",
-        "POSITIVE VIA DIGITAL SKIP - OTHER SOCMED",
-        "POSITIVE VIA DIGITAL SKIP - OTHER SOCMED PLATFORMS",
-        "POSITIVE VIA DIGITAL SKIP - VIBER",
-        "POS VIA SOCMED - GOOGLE SEARCH",
-        "POS VIA SOCMED - LINKEDIN",
-        "POS VIA SOCMED - OTHER SOCMED PLATFORMS",
-        "POS VIA SOCMED - FACEBOOK",
-        "POS VIA SOCMED - VIBER",
-        "POS VIA SOCMED - INSTAGRAM",
-        "POS VIA DIGITAL SKIP - OTHER SOCMED PLATFORMS",
-        "LS VIA SOCMED - T5 BROKEN PTP SPLIT AND OTP",
-        "LS VIA SOCMED - T6 NO RESPONSE (SMS & EMAIL)",
-        "LS VIA SOCMED - T7 PROMO OFFER LETTER",
-        "LS VIA SOCMED - T9 RESTRUCTURING",
-        "LS VIA SOCMED - T1 NOTIFICATION",
-        "LS VIA SOCMED - T12 THIRD PARTY TEMPLATE",
-        "LS VIA SOCMED - T8 AMNESTY PROMO TEMPLATE",
-        "LS VIA SOCMED - T4 BROKEN PTP EPA",
-        "LS VIA SOCMED - T6 NO RESPONSE SMS AND EMAIL",
-        "LS VIA SOCMED - OTHERS",
-        "LS VIA SOCMED - T10 PRE TERMINATION OFFER",
-    ]
-
-    # Define Negative Skip status conditions
-    negative_skip_status = [
-        "BRGY SKIP TRACING_NEGATIVE - CLIENT UNKNOWN",
-        "BRGY SKIP TRACING_NEGATIVE - MOVED OUT",
-        "BRGY SKIP TRACING_NEGATIVE - UNCONTACTED",
-        "NEG VIA DIGITAL SKIP - OTHER SOCMED PLATFORMS",
-        "NEGATIVE VIA DIGITAL SKIP - FACEBOOK",
-        "NEGATIVE VIA DIGITAL SKIP - GOOGLE SEARCH",
-        "NEGATIVE VIA DIGITAL SKIP - INSTAGRAM",
-        "NEGATIVE VIA DIGITAL SKIP - LINKEDIN",
-        "NEGATIVE VIA DIGITAL SKIP - OTHER SOCMED",
-        "NEGATIVE VIA DIGITAL SKIP - OTHER SOCMED PLATFORMS",
-        "NEGATIVE VIA DIGITAL SKIP - VIBER",
-        "NEG VIA SOCMED - OTHER SOCMED PLATFORMS",
-        "NEG VIA SOCMED - FACEBOOK",
-        "NEG VIA SOCMED - VIBER",
-        "NEG VIA SOCMED - GOOGLE SEARCH",
-        "NEG VIA SOCMED - LINKEDIN",
-        "NEG VIA SOCMED - INSTAGRAM",
-        "SMS SENT",
-        "KEEPS ON RINGING_NG",
-    ]
-
-    # Dictionary to store summary DataFrames for each client
-    summary_dfs = {}
-
-    with col1:
-        st.write("## Summary Table by Day")
-        min_date = df['Date'].min().date()
-        max_date = df['Date'].max().date()
-        start_date, end_date = st.date_input("Select date range", [min_date, max_date], min_value=min_date, max_value=max_date)
-        filtered_df = df[(df['Date'].dt.date >= start_date) & (df['Date'].dt.date <= end_date)]
+# Keep every uploaded file in a local history so ranges spanning many days need no re-upload
+use_history = st.sidebar.checkbox("Report from stored history",
+                                  help="Adds each uploaded file to the history and reports on any stored date range")
+
+# Time every stage of this run and count cache hits when asked for; peak memory is
+# added when the server runs with MC06_TRACE_MEMORY=1
+diagnostics = st.sidebar.toggle("Diagnostics", help="Show how long each report stage took on this run")
+profile = RunProfile() if diagnostics else None
+set_active_profile(profile)
+
+# The profile is dropped however the run ends (errors, st.stop, reruns)
+try:
+    # Define columns outside the conditional block
+    col1, col2 = st.columns(2)
+
+    # Content key of the data being reported on, used for the export cache
+    data_hash = None
+    if uploaded_file is not None:
+        data_hash = uploaded_file_digest(uploaded_file)
+        count('load_data calls')
+        with stage('load'):
+            df = load_data(data_hash, uploaded_file)
+        if use_history:
+            # Only the days in this file are rewritten, and only the first time it is seen
+            with stage('append history'):
+                append_remarks(df, data_hash)
+    if use_history:
+        history_days = stored_days()
+        data_hash = store_version() if history_days else None
+
+    if data_hash is not None:
+        # Dictionary to store summary DataFrames for each client
+        summary_dfs = {}
+
+        with col1:
+            st.write("## Summary Table by Day")
+            if use_history:
+                min_date, max_date = history_days[0], history_days[-1]
+            else:
+                min_date = df['Date'].min().date()
+                max_date = df['Date'].max().date()
+            start_date, end_date = st.date_input("Select date range", [min_date, max_date], min_value=min_date, max_value=max_date)
+
+            # Memory held for the uploaded remark rows
+            if uploaded_file is not None:
+                memory_before, memory_after = memory_usage(df)
+                st.sidebar.caption(f"Remark data in memory: {memory_after / 1024 ** 2:.1f} MB "
+                                   f"({memory_before / 1024 ** 2:.1f} MB before compaction)")
+
+            # Results of this data and range are shared by every session viewing the same report
+            results_key = result_key(data_hash, start_date, end_date)
+
+            # Every table comes from the precomputed (Client, Day) and (Client, Day, Status)
+            # cube rows of the range, so changing the range never rescans the remark rows
+            with stage('aggregate'):
+                if use_history:
+                    count('load_history_cubes calls')
+                    client_days, status_days = load_history_cubes(data_hash, CLASSIFIER_VERSION, start_date, end_date)
+                else:
+                    count('load_cubes calls')
+                    client_days, status_days = (slice_cube(cube, start_date, end_date)
+                                                for cube in load_cubes(data_hash, CLASSIFIER_VERSION, df))
+            has_data = client_days is not None and not client_days.empty
 
-        # Debug: Check if filtered_df has data
-        if filtered_df.empty:
-            st.warning("No data available for the selected date range.")
-        else:
-            for client, client_group in filtered_df.groupby('Client'):
-                with st.container():
-                    st.subheader(f"Client: {client}")
+            if not has_data:
+                st.warning("No data available for the selected date range.")
+            else:
+                summary_dfs = cached_result(results_key, 'summaries', lambda: daily_summaries(client_days))
+                # Both breakdowns of every client, built in one grouped pass once one is opened
+                breakdowns = None
+                for client, summary_df in summary_dfs.items():
+                    with st.container():
+                        st.subheader(f"Client: {client}")
                     
-                    # Summary table for daily metrics
-                    st.write("### Daily Summary")
-                    summary_table = []
-                    for date, date_group in client_group.groupby(client_group['Date'].dt.date):
-                        valid_group = date_group[(date_group['Call Duration'].notna()) & 
-                                                (date_group['Call Duration'] > 0) & 
-                                                (date_group['Remark By'].str.lower() != "system")]
-                        total_agents = valid_group['Remark By'].nunique()
-                        total_connected = date_group[date_group['Call Status'] == 'CONNECTED']['Account No.'].count()
-                        total_talk_time_seconds = date_group['Talk Time Duration'].sum()
-                        hours, remainder = divmod(int(total_talk_time_seconds), 3600)
-                        minutes, seconds = divmod(remainder, 60)
-                        formatted_talk_time = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                        talk_time_ave_seconds = total_talk_time_seconds / total_agents if total_agents > 0 else 0
-                        ave_hours, ave_remainder = divmod(int(talk_time_ave_seconds), 3600)
-                        ave_minutes, ave_seconds = divmod(ave_remainder, 60)
-                        talk_time_ave_str = f"{ave_hours:02d}:{ave_minutes:02d}:{ave_seconds:02d}"
-                        positive_skip_count = sum(date_group['Status'].astype(str).str.contains('|'.join(positive_skip_keywords), case=False, na=False))
-                        negative_skip_count = date_group[date_group['Status'].isin(negative_skip_status)].shape[0]
-                        total_skip = positive_skip_count + negative_skip_count
-                        positive_skip_connected = date_group[(date_group['Call Status'] == 'CONNECTED') & 
-                                                            (date_group['Status'].astype(str).str.contains('|'.join(positive_skip_keywords), case=False, na=False))]['Account No.'].count()
-                        negative_skip_connected = date_group[(date_group['Call Status'] == 'CONNECTED') & 
-                                                            (date_group['Status'].isin(negative_skip_status))]['Account No.'].count()
-                        positive_skip_talk_time_seconds = date_group[(date_group['Call Status'] == 'CONNECTED') & 
-                                                                    (date_group['Status'].astype(str).str.contains('|'.join(positive_skip_keywords), case=False, na=False))]['Talk Time Duration'].sum()
-                        negative_skip_talk_time_seconds = date_group[(date_group['Call Status'] == 'CONNECTED') & 
-                                                                    (date_group['Status'].isin(negative_skip_status))]['Talk Time Duration'].sum()
-                        pos_hours, pos_remainder = divmod(int(positive_skip_talk_time_seconds), 3600)
-                        pos_minutes, pos_seconds = divmod(pos_remainder, 60)
-                        positive_skip_talk_time = f"{pos_hours:02d}:{pos_minutes:02d}:{pos_seconds:02d}"
-                        neg_hours, neg_remainder = divmod(int(negative_skip_talk_time_seconds), 3600)
-                        neg_minutes, neg_seconds = divmod(neg_remainder, 60)
-                        negative_skip_talk_time = f"{neg_hours:02d}:{neg_minutes:02d}:{neg_seconds:02d}"
-                        positive_skip_ave = round(positive_skip_count / total_agents, 2) if total_agents > 0 else 0
-                        negative_skip_ave = round(negative_skip_count / total_agents, 2) if total_agents > 0 else 0
-                        total_skip_ave = round(total_skip / total_agents, 2) if total_agents > 0 else 0
-                        connected_ave = round(total_connected / total_agents, 2) if total_agents > 0 else 0
-                        summary_table.append([
-                            date, total_agents, total_connected, positive_skip_count, negative_skip_count, total_skip,
-                            positive_skip_connected, negative_skip_connected, positive_skip_talk_time, negative_skip_talk_time,
-                            formatted_talk_time, positive_skip_ave, negative_skip_ave, total_skip_ave, connected_ave, talk_time_ave_str
-                        ])
-                    summary_df = pd.DataFrame(summary_table, columns=[
-                        'Day', 'Collectors', 'Total Connected', 'Positive Skip', 'Negative Skip', 'Total Skip',
-                        'Positive Skip Connected', 'Negative Skip Connected', 'Positive Skip Talk Time', 'Negative Skip Talk Time',
-                        'Talk Time (HH:MM:SS)', 'Positive Skip Ave', 'Negative Skip Ave', 'Total Skip Ave', 'Connected Ave', 'Talk Time Ave'
-                    ])
-                    st.dataframe(summary_df)
-                    summary_dfs[client] = summary_df
-
-                    # Add spacing
-                    st.write("")  # Single blank line for spacing
-
-                    # Positive Skip Breakdown
-                    st.write("### Positive Skip Breakdown")
-                    positive_skip_group = client_group[client_group['Status'].astype(str).str.contains('|'.join(positive_skip_keywords), case=False, na=False)]
-                    if positive_skip_group.empty:
-                        st.write("No Positive Skip data found.")
-                    else:
-                        for status, status_group in positive_skip_group.groupby('Status'):
-                            with st.container():
-                                st.write(f"**{status}**")
-                                count = status_group.shape[0]
-                                connected = status_group[status_group['Call Status'] == 'CONNECTED']['Account No.'].count()
-                                talk_time_seconds = status_group['Talk Time Duration'].sum()
-                                hours, remainder = divmod(int(talk_time_seconds), 3600)
-                                minutes, seconds = divmod(remainder, 60)
-                                formatted_time = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                                summary_table = pd.DataFrame({
-                                    'Metric': ['Count', 'Connected', 'Talk Time'],
-                                    'Value': [count, connected, formatted_time]
-                                })
-                                st.dataframe(summary_table)
-
-                    # Add spacing
-                    st.write("")  # Single blank line for spacing
-
-                    # Negative Skip Breakdown
-                    st.write("### Negative Skip Breakdown")
-                    client_group['Status'] = client_group['Status'].astype(str).str.strip()
-                    negative_skip_group = client_group[client_group['Status'].str.upper().isin([status.upper() for status in negative_skip_status])]
-                    if negative_skip_group.empty:
-                        st.write("No Negative Skip data found for this client.")
-                        st.write("Expected Negative Skip Statuses:", negative_skip_status)
-                        st.write("Actual Statuses in Data:", client_group['Status'].unique())
-                    else:
-                        for status, status_group in negative_skip_group.groupby('Status'):
-                            with st.container():
-                                st.write(f"**{status}**")
-                                count = status_group.shape[0]
-                                connected = status_group[status_group['Call Status'] == 'CONNECTED']['Account No.'].count()
-                                talk_time_seconds = status_group['Talk Time Duration'].sum()
-                                hours, remainder = divmod(int(talk_time_seconds), 3600)
-                                minutes, seconds = divmod(remainder, 60)
-                                formatted_time = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                                summary_table = pd.DataFrame({
-                                    'Metric': ['Count', 'Connected', 'Talk Time'],
-                                    'Value': [count, connected, formatted_time]
-                                })
-                                st.dataframe(summary_table)
-
-    with col2:
-        st.write("## Overall Summary per Client")
-        with st.container():
-            date_range_str = f"{start_date.strftime('%b %d %Y').upper()} - {end_date.strftime('%b %d %Y').upper()}"
-            valid_df = filtered_df[(filtered_df['Call Duration'].notna()) & 
-                                  (filtered_df['Call Duration'] > 0) & 
-                                  (filtered_df['Remark By'].str.lower() != "system")]
-            avg_collectors_per_client = valid_df.groupby(['Client', valid_df['Date'].dt.date])['Remark By'].nunique().groupby('Client').mean().apply(lambda x: math.ceil(x) if x % 1 >= 0.5 else round(x))
-
-            overall_summary = []
-            for client, client_group in filtered_df.groupby('Client'):
-                if client_group.empty:
-                    st.warning(f"No data for client {client} in the selected date range.")
-                    continue
-
-                total_agents = avg_collectors_per_client.get(client, 0)
-                total_connected = client_group[client_group['Call Status'] == 'CONNECTED']['Account No.'].count()
-                total_talk_time_seconds = client_group['Talk Time Duration'].sum()
-                hours, remainder = divmod(int(total_talk_time_seconds), 3600)
-                minutes, seconds = divmod(remainder, 60)
-                formatted_talk_time = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                positive_skip_count = sum(client_group['Status'].astype(str).str.contains('|'.join(positive_skip_keywords), case=False, na=False))
-                negative_skip_count = client_group[client_group['Status'].isin(negative_skip_status)].shape[0]
-                total_skip = positive_skip_count + negative_skip_count
-                positive_skip_connected = client_group[(client_group['Call Status'] == 'CONNECTED') & 
-                                                      (client_group['Status'].astype(str).str.contains('|'.join(positive_skip_keywords), case=False, na=False))]['Account No.'].count()
-                negative_skip_connected = client_group[(client_group['Call Status'] == 'CONNECTED') & 
-                                                      (client_group['Status'].isin(negative_skip_status))]['Account No.'].count()
-                positive_skip_talk_time_seconds = client_group[(client_group['Call Status'] == 'CONNECTED') & 
-                                                              (client_group['Status'].astype(str).str.contains('|'.join(positive_skip_keywords), case=False, na=False))]['Talk Time Duration'].sum()
-                negative_skip_talk_time_seconds = client_group[(client_group['Call Status'] == 'CONNECTED') & 
-                                                              (client_group['Status'].isin(negative_skip_status))]['Talk Time Duration'].sum()
-                pos_hours, pos_remainder = divmod(int(positive_skip_talk_time_seconds), 3600)
-                pos_minutes, pos_seconds = divmod(pos_remainder, 60)
-                positive_skip_talk_time = f"{pos_hours:02d}:{pos_minutes:02d}:{pos_seconds:02d}"
-                neg_hours, neg_remainder = divmod(int(negative_skip_talk_time_seconds), 3600)
-                neg_minutes, neg_seconds = divmod(neg_remainder, 60)
-                negative_skip_talk_time = f"{neg_hours:02d}:{neg_minutes:02d}:{neg_seconds:02d}"
-                daily_data = client_group.groupby(client_group['Date'].dt.date).agg({
-                    'Remark By': lambda x: x[(client_group['Call Duration'].notna()) & 
-                                            (client_group['Call Duration'] > 0) & 
-                                            (client_group['Remark By'].str.lower() != "system")].nunique(),
-                    'Account No.': lambda x: x[client_group['Call Status'] == 'CONNECTED'].count(),
-                    'Status': [
-                        lambda x: sum(x.astype(str).str.contains('|'.join(positive_skip_keywords), case=False, na=False)),
-                        lambda x: x.isin(negative_skip_status).sum(),
-                        lambda x: x[(client_group['Call Status'] == 'CONNECTED') & 
-                                   (x.astype(str).str.contains('|'.join(positive_skip_keywords), case=False, na=False))].count(),
-                        lambda x: x[(client_group['Call Status'] == 'CONNECTED') & 
-                                   (x.isin(negative_skip_status))].count()
-                    ],
-                    'Talk Time Duration': [
-                        'sum',
-                        lambda x: x[(client_group['Call Status'] == 'CONNECTED') & 
-                                   (client_group['Status'].astype(str).str.contains('|'.join(positive_skip_keywords), case=False, na=False))].sum(),
-                        lambda x: x[(client_group['Call Status'] == 'CONNECTED') & 
-                                   (client_group['Status'].isin(negative_skip_status))].sum()
-                    ]
-                })
-                daily_data.columns = ['Collectors', 'Total Connected', 
-                                     'Positive Skip', 'Negative Skip', 'Positive Skip Connected', 'Negative Skip Connected',
-                                     'Talk Time', 'Positive Skip Talk Time Seconds', 'Negative Skip Talk Time Seconds']
-                daily_data['Total Skip'] = daily_data['Positive Skip'] + daily_data['Negative Skip']
-                daily_data['Positive Skip Ave'] = daily_data['Positive Skip'] / daily_data['Collectors']
-                daily_data['Negative Skip Ave'] = daily_data['Negative Skip'] / daily_data['Collectors']
-                daily_data['Total Skip Ave'] = daily_data['Total Skip'] / daily_data['Collectors']
-                daily_data['Connected Ave'] = daily_data['Total Connected'] / daily_data['Collectors']
-                daily_data['Talk Time Ave Seconds'] = daily_data['Talk Time'] / daily_data['Collectors']
-                positive_skip_ave = round(daily_data['Positive Skip Ave'].mean(), 2) if not daily_data.empty else 0
-                negative_skip_ave = round(daily_data['Negative Skip Ave'].mean(), 2) if not daily_data.empty else 0
-                total_skip_ave = round(daily_data['Total Skip Ave'].mean(), 2) if not daily_data.empty else 0
-                connected_ave = round(daily_data['Connected Ave'].mean(), 2) if not daily_data.empty else 0
-                talk_time_ave_seconds = daily_data['Talk Time Ave Seconds'].mean() if not daily_data.empty else 0
-                ave_hours, ave_remainder = divmod(int(talk_time_ave_seconds), 3600)
-                ave_minutes, ave_seconds = divmod(ave_remainder, 60)
-                talk_time_ave_str = f"{ave_hours:02d}:{ave_minutes:02d}:{ave_seconds:02d}"
-                overall_summary.append([
-                    date_range_str, client, total_agents, total_connected, positive_skip_count, negative_skip_count, total_skip,
-                    positive_skip_connected, negative_skip_connected, positive_skip_talk_time, negative_skip_talk_time,
-                    positive_skip_ave, negative_skip_ave, total_skip_ave, formatted_talk_time, connected_ave, talk_time_ave_str
-                ])
-            overall_summary_df = pd.DataFrame(overall_summary, columns=[
-                'Date Range', 'Client', 'Collectors', 'Total Connected', 'Positive Skip', 'Negative Skip', 'Total Skip',
-                'Positive Skip Connected', 'Negative Skip Connected', 'Positive Skip Talk Time', 'Negative Skip Talk Time',
-                'Positive Skip Ave', 'Negative Skip Ave', 'Total Skip Ave', 'Talk Time (HH:MM:SS)', 'Connected Ave', 'Talk Time Ave'
-            ])
-            
-            # Check if overall_summary_df is empty
-            if overall_summary_df.empty:
-                st.warning("No overall summary data available for the selected date range.")
+                        # Summary table for daily metrics
+                        st.write("### Daily Summary")
+                        st.dataframe(summary_df)
+
+                        # Add spacing
+                        st.write("")  # Single blank line for spacing
+
+                        # Breakdowns are only sent to the browser for the clients they are opened for
+                        if not st.toggle("Show Skip Breakdown", key=f"skip_breakdown_{client}"):
+                            continue
+                        if breakdowns is None:
+                            breakdown_df = cached_result(results_key, 'breakdowns', lambda: skip_breakdown(status_days))
+                            breakdowns = dict(tuple(breakdown_df.groupby('Client', observed=True)))
+                        client_breakdown = breakdowns.get(client)
+
+                        # Positive Skip Breakdown
+                        st.write("### Positive Skip Breakdown")
+                        positive_breakdown = None if client_breakdown is None else client_breakdown[client_breakdown['Skip'] == 'Positive']
+                        if positive_breakdown is None or positive_breakdown.empty:
+                            st.write("No Positive Skip data found.")
+                        else:
+                            st.dataframe(positive_breakdown[BREAKDOWN_COLUMNS], hide_index=True)
+
+                        # Add spacing
+                        st.write("")  # Single blank line for spacing
+
+                        # Negative Skip Breakdown
+                        st.write("### Negative Skip Breakdown")
+                        negative_breakdown = None if client_breakdown is None else client_breakdown[client_breakdown['Skip'] == 'Negative']
+                        if negative_breakdown is None or negative_breakdown.empty:
+                            st.write("No Negative Skip data found for this client.")
+                            st.write("Expected Negative Skip Statuses:", negative_skip_status)
+                            st.write("Actual Statuses in Data:", client_statuses(status_days, client))
+                        else:
+                            st.dataframe(negative_breakdown[BREAKDOWN_COLUMNS], hide_index=True)
+
+        with col2:
+            st.write("## Overall Summary per Client")
+            with st.container():
+                date_range_str = format_date_range(start_date, end_date)
+                # Roll the per-day rows already aggregated for the Daily Summary up per client
+                if has_data:
+                    overall_summary_df = cached_result(results_key, 'overall', lambda: overall_summary(client_days, date_range_str))
+
+                # Check if overall_summary_df is empty
+                if not has_data or overall_summary_df.empty:
+                    st.warning("No overall summary data available for the selected date range.")
+                else:
+                    st.dataframe(overall_summary_df)
+
+                    # Generate the Excel file only once requested, so reruns don't pay for it
+                    if st.button("Prepare Download"):
+                        st.session_state['export_key'] = results_key
+                    if st.session_state.get('export_key') == results_key:
+                        excel_data = cached_result(results_key, 'export',
+                                                   lambda: create_combined_excel_file(summary_dfs, overall_summary_df))
+
+                        # Use st.download_button for reliable download
+                        st.download_button(
+                            label="Download All Results",
+                            data=excel_data,
+                            file_name="MC06_Monitoring_Results.xlsx",
+                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                        )
+
+    # Stage timings of this run, downloadable to compare runs and file sizes
+    if profile is not None:
+        with st.sidebar.expander("Diagnostics", expanded=True):
+            records = profile.records()
+            if records:
+                st.dataframe(records, hide_index=True,
+                             column_config={'seconds': st.column_config.NumberColumn(format="%.3f")})
             else:
-                st.dataframe(overall_summary_df)
-
-                # Generate the Excel file content with formatted tables
-                excel_data = create_combined_excel_file(summary_dfs, overall_summary_df)
-
-                # Use st.download_button for reliable download
-                st.download_button(
-                    label="Download All Results",
-                    data=excel_data,
-                    file_name="MC06_Monitoring_Results.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                )
+                st.write("No report stages ran.")
+            if profile.counters:
+                st.dataframe([{'counter': name, 'value': value} for name, value in sorted(profile.counters.items())],
+                             hide_index=True)
+            st.download_button("Download timings (JSON)", profile.to_json(),
+                               file_name="MC06_diagnostics.json", mime="application/json")
+            st.download_button("Download timings (CSV)", profile.to_csv(),
+                               file_name="MC06_diagnostics.csv", mime="text/csv")
+finally:
+    set_active_profile(None)
@@ -0,0 +1 @@
+# Core report logic for the MC06 monitoring app, kept free of Streamlit calls
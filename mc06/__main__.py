@@ -0,0 +1,5 @@
+import sys
+
+from mc06.cli import main
+
+sys.exit(main())
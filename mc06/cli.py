@@ -0,0 +1,107 @@
+# Generate MC06 report workbooks without Streamlit, e.g. from a nightly job:
+#
+#     python -m mc06 remarks/ --start 2025-03-01 --end 2025-03-31 --output-dir reports/
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+
+from mc06.export import create_combined_excel_file
+from mc06.ingest import load_remarks
+from mc06.report import build_report
+
+REPORT_SUFFIX = "_MC06_Monitoring_Results.xlsx"
+
+
+# Every .xlsx named on the command line, expanding directories (not recursively)
+def find_inputs(paths):
+    inputs = []
+    for path in paths:
+        if os.path.isdir(path):
+            inputs.extend(sorted(
+                os.path.join(path, name) for name in os.listdir(path)
+                # Skip Excel lock files and reports written by an earlier run
+                if name.endswith('.xlsx') and not name.startswith('~$') and not name.endswith(REPORT_SUFFIX)
+            ))
+        else:
+            inputs.append(path)
+    return inputs
+
+
+# Report path of every input, keeping each input's directory relative to the directory
+# all inputs share, so teamA/remarks.xlsx and teamB/remarks.xlsx get separate reports
+def output_paths(inputs, output_dir):
+    base_dir = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in inputs])
+    paths = {}
+    for path in inputs:
+        relative = os.path.relpath(os.path.abspath(path), base_dir)
+        paths[path] = os.path.join(output_dir, os.path.splitext(relative)[0] + REPORT_SUFFIX)
+    return paths
+
+
+# Write the report of one remark file; returns the report path, or None when the
+# selected range holds no data
+def generate_report(input_path, output_path, start_date=None, end_date=None, constant_memory=None):
+    with open(input_path, 'rb') as remark_file:
+        df = load_remarks(remark_file.read())
+    if df['Date'].notna().sum() == 0:
+        return None
+    summary_dfs, overall_summary_df = build_report(df, start_date, end_date)
+    if overall_summary_df.empty:
+        return None
+
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    with open(output_path, 'wb') as report_file:
+        report_file.write(create_combined_excel_file(summary_dfs, overall_summary_df, constant_memory))
+    return output_path
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m mc06', description="Generate MC06 monitoring reports from Daily Remark files.")
+    parser.add_argument('inputs', nargs='+', help="remark workbooks (.xlsx) or directories containing them")
+    parser.add_argument('--start', type=date.fromisoformat, help="first day to report, YYYY-MM-DD (default: first day in each file)")
+    parser.add_argument('--end', type=date.fromisoformat, help="last day to report, YYYY-MM-DD (default: last day in each file)")
+    parser.add_argument('--output-dir', default='.', help="directory the reports are written to (default: current directory)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="files processed in parallel (default: CPU count)")
+    parser.add_argument('--constant-memory', action='store_true', default=None,
+                        help="always write workbooks in xlsxwriter constant_memory mode")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # A file named both directly and through its directory is reported once
+    inputs = list(dict.fromkeys(find_inputs(args.inputs)))
+    if not inputs:
+        print("No remark files found.", file=sys.stderr)
+        return 1
+    reports = output_paths(inputs, args.output_dir)
+    # The same file named twice would have both jobs write one report
+    targets = {}
+    for path, output_path in reports.items():
+        if output_path in targets:
+            print(f"{path} and {targets[output_path]} would both write {output_path}", file=sys.stderr)
+            return 1
+        targets[output_path] = path
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    failures = 0
+    with ProcessPoolExecutor(max_workers=max(1, min(args.workers, len(inputs)))) as pool:
+        futures = {
+            pool.submit(generate_report, path, reports[path], args.start, args.end, args.constant_memory): path
+            for path in inputs
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                output_path = future.result()
+            except Exception as exc:
+                failures += 1
+                print(f"{path}: failed: {exc}", file=sys.stderr)
+                continue
+            if output_path is None:
+                print(f"{path}: no data for the selected date range")
+            else:
+                print(f"{path}: wrote {output_path}")
+    return 1 if failures else 0
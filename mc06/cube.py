@@ -0,0 +1,35 @@
+import pandas as pd
+
+from mc06.instrument import timed
+from mc06.metrics import aggregate_client_days, aggregate_status_days, classify_rows
+
+# The cube holds one row of additive metrics per (Client, Day), as built by
+# aggregate_client_days; the status cube one row per (Client, Day, Status), as built
+# by aggregate_status_days. Every report table for a date range is a slice or a
+# roll-up of these rows, so changing the range never rescans the remark rows.
+
+
+# Precompute the per-client-per-day cube of a whole remark frame
+@timed('build cube')
+def build_cube(df):
+    return aggregate_client_days(classify_rows(df))
+
+
+# Both cubes of a whole remark frame, from one classification pass
+@timed('build cube')
+def build_cubes(df):
+    classified = classify_rows(df)
+    return aggregate_client_days(classified), aggregate_status_days(classified)
+
+
+# Cube rows whose Day falls between start_date and end_date (inclusive)
+def slice_cube(cube, start_date, end_date):
+    days = cube.index.get_level_values('Day')
+    return cube[(days >= pd.Timestamp(start_date)) & (days <= pd.Timestamp(end_date))]
+
+
+# Join cubes of separate days back into one cube ordered by (Client, Day)
+def concat_cubes(cubes):
+    if len(cubes) == 1:
+        return cubes[0]
+    return pd.concat(cubes).sort_index()
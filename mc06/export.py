@@ -0,0 +1,103 @@
+from io import BytesIO
+
+import xlsxwriter
+
+from mc06.instrument import timed
+
+# Above this many data cells the workbook is written in xlsxwriter's constant_memory
+# mode, which flushes every finished row to disk instead of keeping the sheet in memory
+CONSTANT_MEMORY_CELLS = 1_000_000
+
+# Width of the 'Day' column, wide enough for the 'mmm dd, yyyy' date format
+DAY_COLUMN_WIDTH = len('MMM DD, YYYY')
+
+
+# Widest text in each column (or its header), as shown in the report
+def _column_widths(df, fixed_widths=None):
+    fixed_widths = fixed_widths or {}
+    widths = []
+    for col_idx, col in enumerate(df.columns):
+        if col_idx in fixed_widths:
+            width = fixed_widths[col_idx]
+        else:
+            width = df[col].astype(str).str.len().max()
+        widths.append(max(width, len(str(col))))
+    return widths
+
+
+# Write one table with a header row; each column uses a single format.
+# Columns are written with write_column, or row by row in constant_memory mode,
+# where rows have to be written in order.
+def _write_table(worksheet, df, header_format, column_formats, widths, row_wise):
+    worksheet.write_row(0, 0, list(df.columns), header_format)
+    columns = [df[col].tolist() for col in df.columns]
+    if row_wise:
+        for row_idx, row in enumerate(zip(*columns), start=1):
+            for col_idx, value in enumerate(row):
+                worksheet.write(row_idx, col_idx, value, column_formats[col_idx])
+    else:
+        for col_idx, values in enumerate(columns):
+            worksheet.write_column(1, col_idx, values, column_formats[col_idx])
+    for col_idx, width in enumerate(widths):
+        worksheet.set_column(col_idx, col_idx, width + 2)
+
+
+# Function to create a single Excel file with multiple sheets, auto-fit columns, borders, middle alignment, red headers, and custom date formats
+@timed('export')
+def create_combined_excel_file(summary_dfs, overall_summary_df, constant_memory=None):
+    if constant_memory is None:
+        cells = sum(df.size for df in summary_dfs.values()) + overall_summary_df.size
+        constant_memory = cells > CONSTANT_MEMORY_CELLS
+
+    output = BytesIO()
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': constant_memory})
+    header_format = workbook.add_format({
+        'bg_color': '#FF0000',  # Red background
+        'font_color': '#FFFFFF',  # White text
+        'bold': True,
+        'border': 1,
+        'align': 'center',
+        'valign': 'vcenter'
+    })
+    cell_format = workbook.add_format({
+        'border': 1,
+        'align': 'center',
+        'valign': 'vcenter'
+    })
+    date_format = workbook.add_format({
+        'num_format': 'mmm dd, yyyy',  # e.g., Mar 25, 2025
+        'border': 1,
+        'align': 'center',
+        'valign': 'vcenter'
+    })
+    date_range_format = workbook.add_format({
+        'border': 1,
+        'align': 'center',
+        'valign': 'vcenter'
+    })
+    time_format = workbook.add_format({
+        'num_format': 'hh:mm:ss',  # e.g., 01:23:45
+        'border': 1,
+        'align': 'center',
+        'valign': 'vcenter'
+    })
+
+    for client, summary_df in summary_dfs.items():
+        worksheet = workbook.add_worksheet(f"Summary_{client[:31]}")
+        column_formats = [cell_format] * len(summary_df.columns)
+        column_formats[0] = date_format  # 'Day' column
+        for col_idx in [6, 8, 9]:  # Talk Time columns (Total, Positive Skip, Negative Skip)
+            column_formats[col_idx] = time_format
+        widths = _column_widths(summary_df, fixed_widths={0: DAY_COLUMN_WIDTH})
+        _write_table(worksheet, summary_df, header_format, column_formats, widths, constant_memory)
+
+    worksheet = workbook.add_worksheet("Overall_Summary")
+    column_formats = [cell_format] * len(overall_summary_df.columns)
+    column_formats[0] = date_range_format  # 'Date Range' column
+    for col_idx in [10, 12, 13]:  # Talk Time columns (Total, Positive Skip, Negative Skip)
+        column_formats[col_idx] = time_format
+    widths = _column_widths(overall_summary_df)
+    _write_table(worksheet, overall_summary_df, header_format, column_formats, widths, constant_memory)
+
+    workbook.close()
+    return output.getvalue()
@@ -0,0 +1,106 @@
+import hashlib
+import os
+import tempfile
+from io import BytesIO
+
+import pandas as pd
+
+from mc06.instrument import count, stage
+from mc06.reader import read_remarks
+
+# Where converted uploads are kept, shared by every session and worker on the host
+CACHE_DIR = os.environ.get('MC06_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'mc06_cache'))
+
+# Total size the cached Parquet files may use before the least recently used are removed
+CACHE_MAX_BYTES = int(os.environ.get('MC06_CACHE_MAX_BYTES', 2 * 1024 ** 3))
+
+# Bump when read_remarks/normalize_remarks change so files converted by older code are not reused
+CACHE_VERSION = 3
+
+
+# Content hash of an uploaded workbook, used as its cache key
+def file_digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+# Create path by calling write(tmp_path) on a temporary file and renaming it into
+# place, so other workers never read a half-written file
+def write_atomic(path, write):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    os.close(fd)
+    try:
+        write(tmp_path)
+        # mkstemp creates owner-only files; workers running as other users read them too
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def write_parquet(df, path, index=False):
+    write_atomic(path, lambda tmp_path: df.to_parquet(tmp_path, index=index))
+
+
+def _cache_path(digest):
+    return os.path.join(CACHE_DIR, f"{digest}-v{CACHE_VERSION}.parquet")
+
+
+# Remove the least recently used files until the cache fits in CACHE_MAX_BYTES
+def evict_cache(keep=None):
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        if not name.endswith('.parquet'):
+            continue
+        path = os.path.join(CACHE_DIR, name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_bytes <= CACHE_MAX_BYTES:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total_bytes -= size
+
+
+# Load an uploaded Daily Remark workbook, converting it to Parquet on first sight.
+# Later loads of the same content (any session or worker) memory-map the Parquet file.
+def load_remarks(data, digest=None):
+    path = _cache_path(digest or file_digest(data))
+    if os.path.exists(path):
+        try:
+            with stage('read parquet cache'):
+                df = pd.read_parquet(path, memory_map=True)
+        except (OSError, ValueError):
+            # A partial or corrupt file; convert the workbook again below
+            pass
+        else:
+            # Reads count as use for LRU eviction. Only the file's owner may set its
+            # times; a file written by another user's worker is still good to use.
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            count('ingest cache hit')
+            return df
+
+    count('ingest cache miss')
+    df = read_remarks(BytesIO(data))
+    try:
+        write_parquet(df, path)
+    except Exception:
+        # Caching is best effort; the converted frame is still good to use
+        return df
+    evict_cache(keep=path)
+    return df
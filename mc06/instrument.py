@@ -0,0 +1,120 @@
+import csv
+import json
+import os
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from io import StringIO
+
+# Measure the peak memory of every stage with tracemalloc. Tracing is process-wide and
+# slows every session down, so it is a server setting, not part of a session's
+# Diagnostics toggle. It is never stopped once started, and peaks are only exact while
+# a single report runs in the process at a time.
+TRACE_MEMORY = os.environ.get('MC06_TRACE_MEMORY', '') == '1'
+
+# Profile the current report run records into; None when diagnostics are off
+_active_profile = ContextVar('mc06_active_profile', default=None)
+
+
+# Timings, row counts, peak memory (when TRACE_MEMORY is on) and counters of one report run
+class RunProfile:
+    def __init__(self):
+        self.stages = {}
+        self.counters = Counter()
+        self._stack = []
+        if TRACE_MEMORY and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _enter(self):
+        frame = {'start': time.perf_counter(), 'peak': 0, 'memory_start': 0}
+        if TRACE_MEMORY:
+            current, peak = tracemalloc.get_traced_memory()
+            # Fold the peak seen so far into the enclosing stage before resetting it
+            if self._stack:
+                self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak)
+            tracemalloc.reset_peak()
+            frame['memory_start'] = current
+        self._stack.append(frame)
+        return frame
+
+    def _exit(self, name, frame, rows):
+        self._stack.pop()
+        seconds = time.perf_counter() - frame['start']
+        peak_bytes = None
+        if TRACE_MEMORY:
+            frame['peak'] = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+            peak_bytes = max(frame['peak'] - frame['memory_start'], 0)
+            if self._stack:
+                self._stack[-1]['peak'] = max(self._stack[-1]['peak'], frame['peak'])
+            tracemalloc.reset_peak()
+
+        # Stages entered more than once (e.g. one per chunk) are summed
+        stage = self.stages.setdefault(name, {'calls': 0, 'seconds': 0.0, 'rows': None, 'peak_memory_bytes': None})
+        stage['calls'] += 1
+        stage['seconds'] += seconds
+        if rows is not None:
+            stage['rows'] = (stage['rows'] or 0) + rows
+        if peak_bytes is not None:
+            stage['peak_memory_bytes'] = max(stage['peak_memory_bytes'] or 0, peak_bytes)
+
+    @contextmanager
+    def stage(self, name, rows=None):
+        frame = self._enter()
+        try:
+            yield
+        finally:
+            self._exit(name, frame, rows)
+
+    def records(self):
+        return [{'stage': name, **stage} for name, stage in self.stages.items()]
+
+    def to_json(self):
+        return json.dumps({'stages': self.records(), 'counters': dict(self.counters)}, indent=2)
+
+    # Stages first, then one row per counter with its value in 'calls'
+    def to_csv(self):
+        output = StringIO()
+        fields = ['stage', 'calls', 'seconds', 'rows', 'peak_memory_bytes']
+        writer = csv.DictWriter(output, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(self.records())
+        for name, value in self.counters.items():
+            writer.writerow({'stage': name, 'calls': value})
+        return output.getvalue()
+
+
+# Make profile the one stage() and count() record into (None turns recording off)
+def set_active_profile(profile):
+    _active_profile.set(profile)
+
+
+# Time a block of the report as a named stage; does nothing when no profile is active
+@contextmanager
+def stage(name, rows=None):
+    profile = _active_profile.get()
+    if profile is None:
+        yield
+        return
+    with profile.stage(name, rows):
+        yield
+
+
+# Decorator form of stage(), for functions that are a stage as a whole
+def timed(name):
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Add to a named counter (cache hits and misses, files, ...) of the active profile
+def count(name, amount=1):
+    profile = _active_profile.get()
+    if profile is not None:
+        profile.counters[name] += amount
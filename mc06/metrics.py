@@ -0,0 +1,207 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from mc06.instrument import stage, timed
+from mc06.skip_status import POSITIVE_SKIP, NEGATIVE_SKIP, classify_statuses
+
+# Columns of the per-client Daily Summary table, in display/export order
+SUMMARY_COLUMNS = [
+    'Day', 'Collectors', 'Total Connected', 'Positive Skip', 'Negative Skip', 'Total Skip',
+    'Positive Skip Connected', 'Negative Skip Connected', 'Positive Skip Talk Time', 'Negative Skip Talk Time',
+    'Talk Time (HH:MM:SS)', 'Positive Skip Ave', 'Negative Skip Ave', 'Total Skip Ave', 'Connected Ave', 'Talk Time Ave'
+]
+
+# Columns of the Overall Summary table, one row per client
+OVERALL_COLUMNS = [
+    'Date Range', 'Client', 'Collectors', 'Total Connected', 'Positive Skip', 'Negative Skip', 'Total Skip',
+    'Positive Skip Connected', 'Negative Skip Connected', 'Positive Skip Talk Time', 'Negative Skip Talk Time',
+    'Positive Skip Ave', 'Negative Skip Ave', 'Total Skip Ave', 'Talk Time (HH:MM:SS)', 'Connected Ave', 'Talk Time Ave'
+]
+
+
+# Columns of a client's Positive / Negative Skip Breakdown table
+BREAKDOWN_COLUMNS = ['Status', 'Count', 'Connected', 'Talk Time']
+
+
+# Format a number of seconds as HH:MM:SS (fractions are truncated)
+def format_seconds(seconds):
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+# Round each value with Python's round() so results match the per-row report exactly
+def _round_ratio(numerator, denominator):
+    return [round(n / d, 2) if d > 0 else 0 for n, d in zip(numerator, denominator)]
+
+
+# Same as _round_ratio but with numpy's rounding, which the report applies to
+# Connected Ave because its numerator has always been a numpy scalar from count()
+def _round_ratio_numpy(numerator, denominator):
+    return np.round(numerator / denominator.where(denominator > 0), 2).fillna(0).to_numpy()
+
+
+# Classify every row once into the flags all report tables are built from
+def classify_rows(df):
+    with stage('classify', rows=len(df)):
+        classified = df.copy()
+        skip_class = classify_statuses(classified['Status'])
+        classified['Day'] = classified['Date'].dt.normalize()
+        classified['is_connected'] = classified['Call Status'] == 'CONNECTED'
+        classified['is_positive_skip'] = skip_class == POSITIVE_SKIP
+        classified['is_negative_skip'] = skip_class == NEGATIVE_SKIP
+        classified['is_valid_agent_row'] = ((classified['Call Duration'].notna()) &
+                                            (classified['Call Duration'] > 0) &
+                                            (classified['Remark By'].str.lower() != "system"))
+    return classified
+
+
+# Aggregate the additive per (Client, Day) metrics in a single groupby pass
+def aggregate_client_days(classified):
+    connected = classified['is_connected']
+    positive_connected = connected & classified['is_positive_skip']
+    negative_connected = connected & classified['is_negative_skip']
+    talk_time = classified['Talk Time Duration']
+    account = classified['Account No.']
+    frame = pd.DataFrame({
+        'Client': classified['Client'],
+        'Day': classified['Day'],
+        'is_valid_agent_row': classified['is_valid_agent_row'],
+        'valid_agent': classified['Remark By'].where(classified['is_valid_agent_row']),
+        'connected_account': account.where(connected),
+        'is_positive_skip': classified['is_positive_skip'],
+        'is_negative_skip': classified['is_negative_skip'],
+        'positive_connected_account': account.where(positive_connected),
+        'negative_connected_account': account.where(negative_connected),
+        'talk_time': talk_time,
+        'positive_talk_time': talk_time.where(positive_connected, 0),
+        'negative_talk_time': talk_time.where(negative_connected, 0),
+    })
+    return frame.groupby(['Client', 'Day'], sort=True, observed=True).agg(**{
+        'Valid Rows': ('is_valid_agent_row', 'sum'),
+        'Collectors': ('valid_agent', 'nunique'),
+        'Total Connected': ('connected_account', 'count'),
+        'Positive Skip': ('is_positive_skip', 'sum'),
+        'Negative Skip': ('is_negative_skip', 'sum'),
+        'Positive Skip Connected': ('positive_connected_account', 'count'),
+        'Negative Skip Connected': ('negative_connected_account', 'count'),
+        'Talk Time Seconds': ('talk_time', 'sum'),
+        'Positive Skip Talk Time Seconds': ('positive_talk_time', 'sum'),
+        'Negative Skip Talk Time Seconds': ('negative_talk_time', 'sum'),
+    })
+
+
+# Turn aggregated (Client, Day) rows into the Daily Summary table layout
+def format_daily_summary(client_days):
+    collectors = client_days['Collectors']
+    total_skip = client_days['Positive Skip'] + client_days['Negative Skip']
+    talk_time_ave = [t / c if c > 0 else 0 for t, c in zip(client_days['Talk Time Seconds'], collectors)]
+    summary_df = pd.DataFrame({
+        'Day': client_days.index.get_level_values('Day').date,
+        'Collectors': collectors.to_numpy(),
+        'Total Connected': client_days['Total Connected'].to_numpy(),
+        'Positive Skip': client_days['Positive Skip'].to_numpy(),
+        'Negative Skip': client_days['Negative Skip'].to_numpy(),
+        'Total Skip': total_skip.to_numpy(),
+        'Positive Skip Connected': client_days['Positive Skip Connected'].to_numpy(),
+        'Negative Skip Connected': client_days['Negative Skip Connected'].to_numpy(),
+        'Positive Skip Talk Time': client_days['Positive Skip Talk Time Seconds'].map(format_seconds).to_numpy(),
+        'Negative Skip Talk Time': client_days['Negative Skip Talk Time Seconds'].map(format_seconds).to_numpy(),
+        'Talk Time (HH:MM:SS)': client_days['Talk Time Seconds'].map(format_seconds).to_numpy(),
+        'Positive Skip Ave': _round_ratio(client_days['Positive Skip'], collectors),
+        'Negative Skip Ave': _round_ratio(client_days['Negative Skip'], collectors),
+        'Total Skip Ave': _round_ratio(total_skip, collectors),
+        'Connected Ave': _round_ratio_numpy(client_days['Total Connected'], collectors),
+        'Talk Time Ave': [format_seconds(t) for t in talk_time_ave],
+    })
+    return summary_df[SUMMARY_COLUMNS]
+
+
+# Build the Daily Summary table of every client, keyed by client name
+@timed('daily summary')
+def daily_summaries(client_days):
+    summary_dfs = {}
+    for client, client_rows in client_days.groupby(level='Client', sort=False, observed=True):
+        summary_dfs[client] = format_daily_summary(client_rows)
+    return summary_dfs
+
+
+# Average collectors per day, rounding halves up to a whole collector
+def _round_collectors(average):
+    return math.ceil(average) if average % 1 >= 0.5 else round(average)
+
+
+# Roll the same (Client, Day) rows the Daily Summary uses up into one row per client.
+# Averages are the mean of the daily ratios, as in the per-day tables.
+@timed('overall summary')
+def overall_summary(client_days, date_range_str):
+    overall_rows = []
+    for client, days in client_days.groupby(level='Client', sort=False, observed=True):
+        collectors = days['Collectors']
+        # Only days with at least one valid agent row count towards the collector average
+        collector_days = collectors[days['Valid Rows'] > 0]
+        total_agents = _round_collectors(collector_days.mean()) if not collector_days.empty else 0
+        positive_skip_count = days['Positive Skip'].sum()
+        negative_skip_count = days['Negative Skip'].sum()
+        total_skip = days['Positive Skip'] + days['Negative Skip']
+        talk_time_ave_seconds = (days['Talk Time Seconds'] / collectors).mean()
+        overall_rows.append([
+            date_range_str, client, total_agents, days['Total Connected'].sum(),
+            positive_skip_count, negative_skip_count, positive_skip_count + negative_skip_count,
+            days['Positive Skip Connected'].sum(), days['Negative Skip Connected'].sum(),
+            format_seconds(days['Positive Skip Talk Time Seconds'].sum()),
+            format_seconds(days['Negative Skip Talk Time Seconds'].sum()),
+            round((days['Positive Skip'] / collectors).mean(), 2),
+            round((days['Negative Skip'] / collectors).mean(), 2),
+            round((total_skip / collectors).mean(), 2),
+            format_seconds(days['Talk Time Seconds'].sum()),
+            round((days['Total Connected'] / collectors).mean(), 2),
+            format_seconds(talk_time_ave_seconds),
+        ])
+    return pd.DataFrame(overall_rows, columns=OVERALL_COLUMNS)
+
+
+# Aggregate row count, connected rows and talk time per (Client, Day, Status) in one
+# groupby pass. Every status is kept, with its 'Skip' class ('Positive', 'Negative', or
+# '' for other statuses), so breakdowns for any date range are roll-ups of these rows.
+# Blank statuses are kept as a NaN Status, so a client whose rows all lack a status is
+# still in the cube.
+def aggregate_status_days(classified):
+    keyed = classified['Client'].notna() & classified['Day'].notna()
+    frame = pd.DataFrame({
+        'Client': classified['Client'],
+        'Day': classified['Day'],
+        'Status': classified['Status'],
+        'connected_account': classified['Account No.'].where(classified['is_connected']),
+        'talk_time': classified['Talk Time Duration'],
+    })[keyed]
+    status_days = frame.groupby(['Client', 'Day', 'Status'], sort=True, observed=True, dropna=False).agg(**{
+        'Count': ('talk_time', 'size'),
+        'Connected': ('connected_account', 'count'),
+        'Talk Time Seconds': ('talk_time', 'sum'),
+    })
+    skip_class = classify_statuses(pd.Series(status_days.index.get_level_values('Status')))
+    status_days['Skip'] = np.select([skip_class == POSITIVE_SKIP, skip_class == NEGATIVE_SKIP],
+                                    ['Positive', 'Negative'], default='')
+    return status_days
+
+
+# Count, connected rows and talk time per Status of every client's Positive and
+# Negative Skips, rolled up from aggregate_status_days rows. Returns a long table
+# with a 'Skip' column ('Positive' / 'Negative').
+@timed('breakdowns')
+def skip_breakdown(status_days):
+    skips = status_days[status_days['Skip'] != '']
+    breakdown = skips.groupby(['Client', 'Skip', 'Status'], sort=True, observed=True)[
+        ['Count', 'Connected', 'Talk Time Seconds']].sum().reset_index()
+    breakdown['Talk Time'] = breakdown['Talk Time Seconds'].map(format_seconds)
+    return breakdown.drop(columns='Talk Time Seconds')
+
+
+# Distinct statuses of one client in the status cube rows, blank ones as NaN
+def client_statuses(status_days, client):
+    if client not in status_days.index.unique('Client'):
+        return np.array([], dtype=object)
+    return status_days.xs(client, level='Client').index.get_level_values('Status').unique().to_numpy()
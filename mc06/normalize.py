@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# Text columns stored as categoricals; they only hold a few hundred distinct values
+CATEGORICAL_COLUMNS = ['Client', 'Status', 'Call Status', 'Remark By']
+
+# Columns the report still reads once broken-promise remarks are filtered out
+COMPACT_COLUMNS = [
+    'Date', 'Time', 'Client', 'Status', 'Call Status', 'Remark By',
+    'Account No.', 'Talk Time Duration', 'Call Duration'
+]
+
+# Duration columns, downcast to the smallest integer type when they hold whole seconds
+DURATION_COLUMNS = ['Talk Time Duration', 'Call Duration']
+
+# Key of DataFrame.attrs recording the frame's memory use before compact_remarks
+MEMORY_BEFORE_ATTR = 'memory_bytes_before'
+
+
+# Parquet needs one type per column; keep mixed text/number columns as text
+def single_type_columns(df):
+    for col in df.columns:
+        if df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True).startswith('mixed'):
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+
+# Categorical of stripped, upper-cased values. Only the distinct values are
+# normalized; rows are remapped through their category codes.
+def _normalized_categorical(values):
+    values = values.astype('category')
+    labels = values.cat.categories.astype(str).str.strip().str.upper()
+    categories = pd.Index(labels.unique()).sort_values()
+    mapping = categories.get_indexer(labels)
+    codes = values.cat.codes.to_numpy()
+    new_codes = np.where(codes >= 0, mapping[codes], -1)
+    return pd.Series(pd.Categorical.from_codes(new_codes, categories=categories), index=values.index)
+
+
+# Whole-second durations fit an integer type; fractional ones stay float64, since
+# float32 sums over a month of calls would drift by whole seconds
+def _downcast_duration(values):
+    if pd.api.types.is_float_dtype(values) and not (values % 1 == 0).all():
+        return values
+    return pd.to_numeric(values.astype('int64'), downcast='integer')
+
+
+# Seconds since midnight as int32 (-1 when missing) instead of datetime.time objects
+def _seconds_of_day(values):
+    if pd.api.types.is_integer_dtype(values):
+        return values.astype('int32')
+    text = values.astype(str)
+    times = pd.to_datetime(text, format='%H:%M:%S', errors='coerce')
+    # Anything not in the usual HH:MM:SS form (full datetimes, fractions) is parsed one by one
+    retry = times.isna() & values.notna()
+    if retry.any():
+        times[retry] = pd.to_datetime(text[retry], format='mixed', errors='coerce')
+    seconds = (times - times.dt.normalize()).dt.total_seconds()
+    return seconds.fillna(-1).astype('int32')
+
+
+# Shrink a normalized remark frame: drop columns the report never reads, store the
+# text columns as normalized categoricals, downcast durations and keep Time as
+# seconds of the day. Safe to apply to an already compact frame.
+def compact_remarks(df):
+    memory_before = df.attrs.get(MEMORY_BEFORE_ATTR) or int(df.memory_usage(deep=True).sum())
+    df = df[[col for col in COMPACT_COLUMNS if col in df.columns]].copy()
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = _normalized_categorical(df[col])
+    for col in DURATION_COLUMNS:
+        df[col] = _downcast_duration(df[col])
+    if 'Time' in df.columns:
+        df['Time'] = _seconds_of_day(df['Time'])
+    df.attrs[MEMORY_BEFORE_ATTR] = memory_before
+    return df
+
+
+# Memory use of a compact frame before and after compact_remarks, in bytes
+def memory_usage(df):
+    after = int(df.memory_usage(deep=True).sum())
+    return df.attrs.get(MEMORY_BEFORE_ATTR, after), after
+
+
+# Drop "broken promise" remarks and give every column the dtype the report expects
+def normalize_remarks(df):
+    memory_before = int(df.memory_usage(deep=True).sum())
+    # Filter out rows where 'Remark' contains "broken promise" (case-insensitive)
+    df = df[~df['Remark'].astype(str).str.contains("broken promise", case=False, na=False)].copy()
+    df.columns = [str(col) for col in df.columns]
+
+    # Ensure 'Date' column is in datetime format
+    df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
+
+    # Ensure 'Talk Time Duration' and 'Call Duration' are numeric
+    df['Talk Time Duration'] = pd.to_numeric(df['Talk Time Duration'], errors='coerce').fillna(0)
+    df['Call Duration'] = pd.to_numeric(df['Call Duration'], errors='coerce').fillna(0)
+
+    df = single_type_columns(df)
+    df.attrs[MEMORY_BEFORE_ATTR] = memory_before
+    return compact_remarks(df.reset_index(drop=True))
+
+
+# Stitch normalized frames together, merging the categories of each frame
+def concat_remarks(frames):
+    if len(frames) == 1:
+        return frames[0]
+    columns = list(frames[0].columns)
+    categoricals = {
+        col: union_categoricals([frame[col] for frame in frames], sort_categories=True)
+        for col in CATEGORICAL_COLUMNS
+    }
+    df = pd.concat([frame.drop(columns=CATEGORICAL_COLUMNS) for frame in frames], ignore_index=True)
+    for col, values in categoricals.items():
+        df[col] = values
+    df = single_type_columns(df)[columns]
+    df.attrs[MEMORY_BEFORE_ATTR] = sum(frame.attrs.get(MEMORY_BEFORE_ATTR, 0) for frame in frames)
+    return df
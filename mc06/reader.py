@@ -0,0 +1,74 @@
+from operator import itemgetter
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from mc06.instrument import stage, timed
+from mc06.normalize import concat_remarks, normalize_remarks
+
+# The only columns of a Daily Remark export the report reads
+REPORT_COLUMNS = [
+    'Date', 'Time', 'Client', 'Status', 'Call Status', 'Remark', 'Remark By',
+    'Account No.', 'Talk Time Duration', 'Call Duration'
+]
+
+# Rows converted to a DataFrame at a time
+CHUNK_ROWS = 50_000
+
+# Cell texts pd.read_excel treats as missing by default
+NA_STRINGS = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+
+# Normalize one chunk of raw row tuples into a compact frame
+def _chunk_frame(rows):
+    with stage('normalize', rows=len(rows)):
+        chunk = pd.DataFrame.from_records(rows, columns=REPORT_COLUMNS)
+        for col in chunk.columns:
+            if chunk[col].dtype == object:
+                chunk[col] = chunk[col].mask(chunk[col].isin(NA_STRINGS))
+        return normalize_remarks(chunk)
+
+
+# Read a Daily Remark workbook (path or file-like) row by row in read-only mode.
+# Only REPORT_COLUMNS are kept and every chunk is filtered and converted as soon as
+# it is read, so peak memory follows the size of the result rather than the workbook.
+@timed('read workbook')
+def read_remarks(source, chunk_rows=CHUNK_ROWS):
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        # Some exporters write a wrong sheet dimension, which would truncate the rows
+        sheet.reset_dimensions()
+        rows = sheet.iter_rows(values_only=True)
+
+        positions = {}
+        for idx, name in enumerate(next(rows, ())):
+            if name is not None:
+                positions.setdefault(str(name), idx)
+        missing = [col for col in REPORT_COLUMNS if col not in positions]
+        if missing:
+            raise KeyError(f"Columns not found in the remark file: {', '.join(missing)}")
+        indices = [positions[col] for col in REPORT_COLUMNS]
+        width = max(indices) + 1
+        pick = itemgetter(*indices)
+
+        chunks = []
+        buffer = []
+        for row in rows:
+            if len(row) < width:
+                row = row + (None,) * (width - len(row))
+            values = pick(row)
+            if all(value is None for value in values):
+                continue
+            buffer.append(values)
+            if len(buffer) >= chunk_rows:
+                chunks.append(_chunk_frame(buffer))
+                buffer = []
+        if buffer or not chunks:
+            chunks.append(_chunk_frame(buffer))
+    finally:
+        workbook.close()
+    return concat_remarks(chunks)
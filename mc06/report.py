@@ -0,0 +1,18 @@
+from mc06.cube import build_cube, slice_cube
+from mc06.metrics import daily_summaries, overall_summary
+
+
+# Date range label of the Overall Summary, e.g. "MAR 01 2025 - MAR 31 2025"
+def format_date_range(start_date, end_date):
+    return f"{start_date.strftime('%b %d %Y').upper()} - {end_date.strftime('%b %d %Y').upper()}"
+
+
+# Build the Daily Summary tables and the Overall Summary of a remark frame.
+# The range defaults to every day in the frame; returns (summary_dfs, overall_summary_df).
+def build_report(df, start_date=None, end_date=None):
+    if start_date is None:
+        start_date = df['Date'].min().date()
+    if end_date is None:
+        end_date = df['Date'].max().date()
+    client_days = slice_cube(build_cube(df), start_date, end_date)
+    return daily_summaries(client_days), overall_summary(client_days, format_date_range(start_date, end_date))
@@ -0,0 +1,170 @@
+import hashlib
+import os
+import threading
+import time
+
+import pandas as pd
+from cachetools import TTLCache
+
+from mc06.ingest import CACHE_DIR, write_atomic, write_parquet
+from mc06.instrument import count
+from mc06.skip_status import CLASSIFIER_VERSION
+
+# Computed report results shared by every session and worker on the host
+RESULTS_DIR = os.environ.get('MC06_RESULTS_DIR', os.path.join(CACHE_DIR, 'results'))
+
+# Results older than this are computed again, so each report is built about once a day
+RESULTS_TTL_SECONDS = int(os.environ.get('MC06_RESULTS_TTL', 24 * 3600))
+
+# Total size of the result files on disk, and of the results each process keeps in memory
+RESULTS_MAX_BYTES = int(os.environ.get('MC06_RESULTS_MAX_BYTES', 1024 ** 3))
+RESULTS_MEMORY_BYTES = int(os.environ.get('MC06_RESULTS_MEMORY_BYTES', 256 * 1024 ** 2))
+
+# Bump when the summaries or the export change so results of older code are not reused
+RESULTS_VERSION = 1
+
+
+def _result_size(value):
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_result_size(frame) for frame in value.values())
+    return int(value.memory_usage(deep=True).sum())
+
+
+# Values are shared by every session: callers must not modify what they get back
+_memory = TTLCache(maxsize=RESULTS_MEMORY_BYTES, ttl=RESULTS_TTL_SECONDS, getsizeof=_result_size)
+_memory_lock = threading.Lock()
+
+# Sessions asking for the same result wait for the first one to compute it
+_compute_locks = [threading.Lock() for _ in range(64)]
+
+
+def _write_frames(frames, path):
+    if frames:
+        write_parquet(pd.concat(frames, names=['Client']), path, index=True)
+    else:
+        write_parquet(pd.DataFrame(), path)
+
+
+# One frame per client, in the order they were written
+def _read_frames(path):
+    stacked = pd.read_parquet(path)
+    if stacked.empty:
+        return {}
+    return {client: frame.reset_index(drop=True) for client, frame in stacked.groupby(level='Client', sort=False)}
+
+
+def _write_bytes(data, path):
+    def write(tmp_path):
+        with open(tmp_path, 'wb') as result_file:
+            result_file.write(data)
+    write_atomic(path, write)
+
+
+def _read_bytes(path):
+    with open(path, 'rb') as result_file:
+        return result_file.read()
+
+
+# How each kind of result is kept on disk: file suffix, writer and reader
+RESULT_KINDS = {
+    'summaries': ('.parquet', _write_frames, _read_frames),
+    'overall': ('.parquet', write_parquet, pd.read_parquet),
+    'breakdowns': ('.parquet', write_parquet, pd.read_parquet),
+    'export': ('.xlsx', _write_bytes, _read_bytes),
+}
+
+
+# Cache key of the results for one data content (file or store version) and date range
+def result_key(data_hash, start_date, end_date):
+    key = f"{data_hash}|{start_date.isoformat()}|{end_date.isoformat()}|{CLASSIFIER_VERSION}|{RESULTS_VERSION}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _result_path(key, kind):
+    return os.path.join(RESULTS_DIR, f"{key}-{kind}{RESULT_KINDS[kind][0]}")
+
+
+# Remove expired result files, then the oldest until the rest fit in RESULTS_MAX_BYTES
+def evict_results(keep=None):
+    entries = []
+    for name in os.listdir(RESULTS_DIR):
+        if name.endswith('.tmp'):
+            continue
+        path = os.path.join(RESULTS_DIR, name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total_bytes = sum(size for _, size, _ in entries)
+    expired_before = time.time() - RESULTS_TTL_SECONDS
+    for mtime, size, path in sorted(entries):
+        if total_bytes <= RESULTS_MAX_BYTES and mtime >= expired_before:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total_bytes -= size
+
+
+def _read_result(key, kind):
+    path = _result_path(key, kind)
+    try:
+        # Files are never touched after writing, so mtime is when the result was computed
+        if os.stat(path).st_mtime < time.time() - RESULTS_TTL_SECONDS:
+            return None
+        return RESULT_KINDS[kind][2](path)
+    except (OSError, ValueError):
+        # Missing, just evicted or corrupt; compute it again
+        return None
+
+
+def _remember(key, kind, value):
+    with _memory_lock:
+        try:
+            _memory[key, kind] = value
+        except ValueError:
+            # Larger than the whole memory cache; it is still on disk
+            pass
+
+
+# The result of kind for key, from this process, from disk, or computed by compute()
+# and shared with every other session and worker
+def cached_result(key, kind, compute):
+    with _memory_lock:
+        value = _memory.get((key, kind))
+    if value is not None:
+        count(f'{kind} result memory hit')
+        return value
+
+    with _compute_locks[hash((key, kind)) % len(_compute_locks)]:
+        with _memory_lock:
+            value = _memory.get((key, kind))
+        if value is not None:
+            count(f'{kind} result memory hit')
+            return value
+
+        value = _read_result(key, kind)
+        if value is not None:
+            count(f'{kind} result disk hit')
+            _remember(key, kind, value)
+            return value
+
+        count(f'{kind} result miss')
+        value = compute()
+        _remember(key, kind, value)
+        path = _result_path(key, kind)
+        try:
+            os.makedirs(RESULTS_DIR, exist_ok=True)
+            RESULT_KINDS[kind][1](value, path)
+        except Exception:
+            # Sharing results is best effort; this session still has its own
+            return value
+        evict_results(keep=path)
+        return value
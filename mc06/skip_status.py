@@ -0,0 +1,93 @@
+# Status values that count as Positive / Negative skips in the MC06 report
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+
+# Define Positive Skip conditions
+positive_skip_keywords = [
+    "BRGY SKIPTRACE_POS - LEAVE MESSAGE CALL SMS",
+    "BRGY SKIPTRACE_POS - LEAVE MESSAGE FACEBOOK",
+    "POS VIA DIGITAL SKIP - OTHER SOCMED PLATFORMS",
+    "POSITIVE VIA DIGITAL SKIP - FACEBOOK",
+    "POSITIVE VIA DIGITAL SKIP - GOOGLE SEARCH",
+    "POSITIVE VIA DIGITAL SKIP - INSTAGRAM",
+    "POSITIVE VIA DIGITAL SKIP - LINKEDIN",
+    "POSITIVE VIA DIGITAL SKIP - OTHER SOCMED",
+    "POSITIVE VIA DIGITAL SKIP - OTHER SOCMED PLATFORMS",
+    "POSITIVE VIA DIGITAL SKIP - VIBER",
+    "POS VIA SOCMED - GOOGLE SEARCH",
+    "POS VIA SOCMED - LINKEDIN",
+    "POS VIA SOCMED - OTHER SOCMED PLATFORMS",
+    "POS VIA SOCMED - FACEBOOK",
+    "POS VIA SOCMED - VIBER",
+    "POS VIA SOCMED - INSTAGRAM",
+    "POS VIA DIGITAL SKIP - OTHER SOCMED PLATFORMS",
+    "LS VIA SOCMED - T5 BROKEN PTP SPLIT AND OTP",
+    "LS VIA SOCMED - T6 NO RESPONSE (SMS & EMAIL)",
+    "LS VIA SOCMED - T7 PROMO OFFER LETTER",
+    "LS VIA SOCMED - T9 RESTRUCTURING",
+    "LS VIA SOCMED - T1 NOTIFICATION",
+    "LS VIA SOCMED - T12 THIRD PARTY TEMPLATE",
+    "LS VIA SOCMED - T8 AMNESTY PROMO TEMPLATE",
+    "LS VIA SOCMED - T4 BROKEN PTP EPA",
+    "LS VIA SOCMED - T6 NO RESPONSE SMS AND EMAIL",
+    "LS VIA SOCMED - OTHERS",
+    "LS VIA SOCMED - T10 PRE TERMINATION OFFER",
+]
+
+# Define Negative Skip status conditions
+negative_skip_status = [
+    "BRGY SKIP TRACING_NEGATIVE - CLIENT UNKNOWN",
+    "BRGY SKIP TRACING_NEGATIVE - MOVED OUT",
+    "BRGY SKIP TRACING_NEGATIVE - UNCONTACTED",
+    "NEG VIA DIGITAL SKIP - OTHER SOCMED PLATFORMS",
+    "NEGATIVE VIA DIGITAL SKIP - FACEBOOK",
+    "NEGATIVE VIA DIGITAL SKIP - GOOGLE SEARCH",
+    "NEGATIVE VIA DIGITAL SKIP - INSTAGRAM",
+    "NEGATIVE VIA DIGITAL SKIP - LINKEDIN",
+    "NEGATIVE VIA DIGITAL SKIP - OTHER SOCMED",
+    "NEGATIVE VIA DIGITAL SKIP - OTHER SOCMED PLATFORMS",
+    "NEGATIVE VIA DIGITAL SKIP - VIBER",
+    "NEG VIA SOCMED - OTHER SOCMED PLATFORMS",
+    "NEG VIA SOCMED - FACEBOOK",
+    "NEG VIA SOCMED - VIBER",
+    "NEG VIA SOCMED - GOOGLE SEARCH",
+    "NEG VIA SOCMED - LINKEDIN",
+    "NEG VIA SOCMED - INSTAGRAM",
+    "SMS SENT",
+    "KEEPS ON RINGING_NG",
+]
+
+# Bump whenever the status lists or the matching rules change; cached reports are keyed on it
+CLASSIFIER_VERSION = 2
+
+# Classification codes returned by classify_statuses
+NO_SKIP = 0
+POSITIVE_SKIP = 1
+NEGATIVE_SKIP = 2
+
+_positive_keywords = tuple(keyword.upper() for keyword in positive_skip_keywords)
+_negative_statuses = frozenset(status.upper() for status in negative_skip_status)
+
+
+# Decide the skip class of a single Status value.
+# Matching ignores case and surrounding whitespace: a status is a Positive Skip when
+# it contains any positive keyword, and a Negative Skip when it equals a negative status.
+@lru_cache(maxsize=None)
+def classify_status(status):
+    normalized = str(status).strip().upper()
+    if any(keyword in normalized for keyword in _positive_keywords):
+        return POSITIVE_SKIP
+    if normalized in _negative_statuses:
+        return NEGATIVE_SKIP
+    return NO_SKIP
+
+
+# Classify a whole Status column by looking at each distinct value only once
+def classify_statuses(statuses):
+    codes, uniques = pd.factorize(statuses)
+    lookup = np.array([classify_status(status) for status in uniques] + [NO_SKIP], dtype=np.int8)
+    # factorize marks missing values with -1, which picks the trailing NO_SKIP entry
+    return lookup[codes]
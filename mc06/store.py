@@ -0,0 +1,214 @@
+import hashlib
+import os
+from contextlib import contextmanager
+from datetime import date
+
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: no advisory locks, so only one process should append at a time
+    fcntl = None
+
+from mc06.cube import build_cubes, concat_cubes
+from mc06.ingest import write_parquet
+from mc06.normalize import CATEGORICAL_COLUMNS, DURATION_COLUMNS, MEMORY_BEFORE_ATTR, compact_remarks, concat_remarks
+from mc06.skip_status import CLASSIFIER_VERSION
+
+# Persistent history of ingested remark files, one Parquet partition per day
+STORE_DIR = os.environ.get('MC06_STORE_DIR', os.path.join(os.path.expanduser('~'), '.mc06', 'store'))
+
+# Content hashes of every file already appended to the store, one per line
+MANIFEST_NAME = 'ingested.txt'
+
+# Held while partitions and the manifest are rewritten
+LOCK_NAME = '.lock'
+
+# Rows inside a partition are kept in this order
+SORT_COLUMNS = ['Client', 'Date']
+
+
+def _partition_path(day):
+    return os.path.join(STORE_DIR, f"day={day.isoformat()}.parquet")
+
+
+# Names of the per-day cubes, in the order build_cubes returns them
+CUBE_NAMES = ['cube', 'status-cube']
+
+
+# Per-day aggregate cubes depend on how statuses are classified, so they are kept per version
+def _cube_path(day, name='cube'):
+    return os.path.join(STORE_DIR, f"{name}-v{CLASSIFIER_VERSION}", f"day={day.isoformat()}.parquet")
+
+
+def _write_cubes(day, df):
+    for name, cube in zip(CUBE_NAMES, build_cubes(df)):
+        write_parquet(cube, _cube_path(day, name), index=True)
+
+
+def _remove_cubes(day):
+    for name in CUBE_NAMES:
+        try:
+            os.remove(_cube_path(day, name))
+        except FileNotFoundError:
+            pass
+
+
+# Whether a day's cubes are missing or older than its partition, e.g. after a failed write
+def _cubes_outdated(day):
+    partition_mtime = os.stat(_partition_path(day)).st_mtime
+    for name in CUBE_NAMES:
+        try:
+            if os.stat(_cube_path(day, name)).st_mtime < partition_mtime:
+                return True
+        except FileNotFoundError:
+            return True
+    return False
+
+
+# One stored day, compacted if it was written before compact_remarks existed. Parquet
+# keeps DataFrame.attrs, and partitions written earlier carry the memory size of the
+# whole uploaded file; that is dropped so each partition measures its own.
+def _read_partition(day):
+    df = pd.read_parquet(_partition_path(day))
+    df.attrs.pop(MEMORY_BEFORE_ATTR, None)
+    return compact_remarks(df)
+
+
+def _manifest_path():
+    return os.path.join(STORE_DIR, MANIFEST_NAME)
+
+
+# Exclusive lock on the store across processes, so two uploads of the same day don't
+# both rewrite its partition from the same old contents and lose each other's rows
+@contextmanager
+def _store_lock():
+    with open(os.path.join(STORE_DIR, LOCK_NAME), 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _ingested_digests():
+    try:
+        with open(_manifest_path()) as manifest:
+            return set(manifest.read().split())
+    except FileNotFoundError:
+        return set()
+
+
+# Every day that has a partition in the store, oldest first
+def stored_days():
+    if not os.path.isdir(STORE_DIR):
+        return []
+    days = []
+    for name in os.listdir(STORE_DIR):
+        if name.startswith('day=') and name.endswith('.parquet'):
+            days.append(date.fromisoformat(name[len('day='):-len('.parquet')]))
+    return sorted(days)
+
+
+# Changes whenever a file is appended; use it in cache keys for store queries
+def store_version():
+    try:
+        with open(_manifest_path(), 'rb') as manifest:
+            return hashlib.sha256(manifest.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+# Account numbers as text, with whole numbers written without a decimal part, so 123,
+# 123.0 and '123' compare equal whichever type the file's column was read as
+def _canonical_accounts(values):
+    numbers = pd.to_numeric(values, errors='coerce')
+    text = values.astype(str)
+    whole = numbers.notna() & (numbers % 1 == 0)
+    text[whole] = numbers[whole].astype('int64').astype(str)
+    return text
+
+
+# Hash of every row's values. compact_remarks types columns per file (int8 or float64
+# durations, int or text account numbers), so columns are cast to one type first.
+def _row_hashes(df):
+    canonical = df.astype({col: 'float64' for col in DURATION_COLUMNS if col in df.columns})
+    for col in CATEGORICAL_COLUMNS:
+        canonical[col] = canonical[col].astype(str)
+    canonical['Account No.'] = _canonical_accounts(canonical['Account No.'])
+    canonical['Date'] = canonical['Date'].astype('datetime64[ns]')
+    return pd.util.hash_pandas_object(canonical, index=False)
+
+
+# Append one normalized remark file to the store.
+# Only the days present in the file are rewritten, and rows already stored for those
+# days are not added again, so re-uploading a day or overlapping exports is harmless.
+# Returns False when this exact file content was ingested before.
+def append_remarks(df, digest):
+    os.makedirs(STORE_DIR, exist_ok=True)
+    with _store_lock():
+        if digest in _ingested_digests():
+            return False
+
+        dated = df[df['Date'].notna()]
+        for day, day_rows in dated.groupby(dated['Date'].dt.normalize()):
+            path = _partition_path(day.date())
+            if os.path.exists(path):
+                existing = _read_partition(day.date())
+                day_rows = day_rows[existing.columns]
+                # Drop incoming rows that are already stored; repeats within one file are kept
+                seen = set(_row_hashes(existing))
+                day_rows = day_rows[~_row_hashes(day_rows).isin(seen)]
+                if day_rows.empty:
+                    # Nothing new, but an earlier append may have died before its cubes were written
+                    if _cubes_outdated(day.date()):
+                        _write_cubes(day.date(), existing)
+                    continue
+                day_rows = concat_remarks([existing, day_rows])
+            partition = day_rows.sort_values(SORT_COLUMNS, kind='stable')
+            # The upload's memory size before compaction describes the whole file, not this day
+            partition.attrs.pop(MEMORY_BEFORE_ATTR, None)
+            # Old cubes go first: if writing the new ones fails, load_cube_range rebuilds them
+            # from the partition instead of serving cubes of the previous rows
+            _remove_cubes(day.date())
+            write_parquet(partition, path)
+            _write_cubes(day.date(), day_rows)
+
+        with open(_manifest_path(), 'a') as manifest:
+            manifest.write(f"{digest}\n")
+    return True
+
+
+# All stored rows between start_date and end_date (inclusive), reading only those days.
+# Returns None when the store is empty.
+def load_range(start_date, end_date):
+    days = stored_days()
+    if not days:
+        return None
+    frames = [_read_partition(day) for day in days if start_date <= day <= end_date]
+    if not frames:
+        # Nothing stored in that range; keep the columns so the report shows no data
+        return _read_partition(days[0]).iloc[:0]
+    return concat_remarks(frames)
+
+
+# The aggregate cube (or the status cube) for a date range, built from the stored per-day
+# cubes. Days stored before the current classifier version get their cubes built once here.
+def load_cube_range(start_date, end_date, name='cube'):
+    cubes = []
+    for day in stored_days():
+        if not start_date <= day <= end_date:
+            continue
+        path = _cube_path(day, name)
+        if not os.path.exists(path):
+            # Under the store lock, so an append of the same day can't be overwritten by a stale cube
+            with _store_lock():
+                if not os.path.exists(path):
+                    _write_cubes(day, _read_partition(day))
+        cubes.append(pd.read_parquet(path))
+    if not cubes:
+        return None
+    return concat_cubes(cubes)